@@ -1,5 +1,5 @@
-import pandas as pd
 from datetime import date, timedelta
+from excel_schema import load_workbook_columns, role_headers
 
 # Function to compute next date safely
 def get_next_date(d, m, y):
@@ -7,27 +7,31 @@ def get_next_date(d, m, y):
         current_date = date(y, m, d)
         next_date = current_date + timedelta(days=1)
         return next_date.strftime("%d-%m-%Y")
-    except ValueError:
+    except (ValueError, OverflowError):
+        # OverflowError: 31-12-9999 has no next date in datetime's range
         return "Invalid Date"
 
 # === Main Program ===
-def fill_actual_results(input_file, output_file):
-    # Load the Excel file
-    df = pd.read_excel(input_file)
+def fill_actual_results(input_file, output_file, df=None):
+    # Load the Excel file (or work on a copy of an already loaded one)
+    df = load_workbook_columns(input_file) if df is None else df.copy()
+    # Columns keep the workbook's own headers, so find Day/Month/Year/Expected by role
+    headers = role_headers(df.columns)
+    expected_col = headers.get("Expected Output")
 
     for i in range(len(df)):
         # Extract Day, Month, Year from columns
-        d = int(df.loc[i, "Day"])
-        m = int(df.loc[i, "Month"])
-        y = int(df.loc[i, "Year"])
+        d = int(df.loc[i, headers["Day"]])
+        m = int(df.loc[i, headers["Month"]])
+        y = int(df.loc[i, headers["Year"]])
 
         # Compute actual output
         actual = get_next_date(d, m, y)
         df.loc[i, "Actual Output"] = actual
 
         # Compare with expected (if Expected Output column exists)
-        if "Expected Output" in df.columns:
-            if str(df.loc[i, "Expected Output"]).strip() == actual.strip():
+        if expected_col is not None:
+            if str(df.loc[i, expected_col]).strip() == actual.strip():
                 df.loc[i, "Result (Pass/Fail)"] = "Pass"
             else:
                 df.loc[i, "Result (Pass/Fail)"] = "Fail"
@@ -36,8 +40,10 @@ def fill_actual_results(input_file, output_file):
             df.loc[i, "Result (Pass/Fail)"] = "Computed"
 
     # Save updated Excel
-    df.to_excel(output_file, index=False)
-    print(f"Updated file saved as: {output_file}")
+    if output_file:
+        df.to_excel(output_file, index=False)
+        print(f"Updated file saved as: {output_file}")
+    return df
 
 
 # === Run Example ===
@@ -1,10 +1,11 @@
 import pandas as pd
+from excel_schema import load_workbook_columns
 
 def is_leap_year(year):
     """Check if a year is a leap year"""
     return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
 
-def analyze_leap_year_conditions():
+def analyze_leap_year_conditions(df_bva=None, df_comprehensive=None, df_gemini=None):
     print("=== LEAP YEAR ANALYSIS IN TEST CASES ===\n")
     
     # Analyze BVA Test Cases
@@ -12,18 +13,18 @@ def analyze_leap_year_conditions():
     print("-" * 50)
     
     try:
-        df_bva = pd.read_excel('NextDate_BVA_TestCases.xlsx')
+        if df_bva is None:
+            df_bva = load_workbook_columns('NextDate_BVA_TestCases.xlsx', ['Day', 'Month', 'Year', 'Expected Output'])
         
         leap_cases = []
         non_leap_cases = []
         
-        # Start from row 3 where data begins
-        for i in range(3, len(df_bva)):
+        for _, row in df_bva.iterrows():
             try:
-                day = df_bva.iloc[i, 2]
-                month = df_bva.iloc[i, 3] 
-                year = df_bva.iloc[i, 4]
-                expected = df_bva.iloc[i, 5]
+                day = row['Day']
+                month = row['Month']
+                year = row['Year']
+                expected = row.get('Expected Output')
                 
                 if pd.notna(day) and pd.notna(month) and pd.notna(year):
                     day, month, year = int(day), int(month), int(year)
@@ -63,7 +64,8 @@ def analyze_leap_year_conditions():
     print("-" * 50)
     
     try:
-        df_comprehensive = pd.read_excel('next_date_test_cases.xlsx')
+        if df_comprehensive is None:
+            df_comprehensive = load_workbook_columns('next_date_test_cases.xlsx')
         
         leap_years_found = set()
         non_leap_years_found = set()
@@ -134,7 +136,8 @@ def analyze_leap_year_conditions():
     print("-" * 50)
     
     try:
-        df_gemini = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
+        if df_gemini is None:
+            df_gemini = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
         
         gemini_leap_cases = []
         gemini_non_leap_cases = []
@@ -1,36 +1,38 @@
 import pandas as pd
+from excel_schema import load_workbook_columns
 
-def analyze_month_year_boundaries():
+# Days in each month (non-leap year)
+days_in_month = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 
+                 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+
+def is_leap_year(year):
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+def get_max_day(month, year):
+    if month == 2 and is_leap_year(year):
+        return 29
+    return days_in_month.get(month, 30)
+
+def analyze_month_year_boundaries(df_bva=None, df_comprehensive=None, df_gemini=None):
     print("=== MONTH AND YEAR BOUNDARY ANALYSIS ===\n")
     
-    # Days in each month (non-leap year)
-    days_in_month = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 
-                     7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
-    
-    def is_leap_year(year):
-        return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-    
-    def get_max_day(month, year):
-        if month == 2 and is_leap_year(year):
-            return 29
-        return days_in_month.get(month, 30)
-    
     # Analyze BVA Test Cases
     print("1. ANALYZING NextDate_BVA_TestCases.xlsx")
     print("-" * 50)
     
     try:
-        df_bva = pd.read_excel('NextDate_BVA_TestCases.xlsx')
+        if df_bva is None:
+            df_bva = load_workbook_columns('NextDate_BVA_TestCases.xlsx', ['Day', 'Month', 'Year', 'Expected Output'])
         
         year_boundaries = []
         month_boundaries = []
         
-        for i in range(3, len(df_bva)):
+        for _, row in df_bva.iterrows():
             try:
-                day = df_bva.iloc[i, 2]
-                month = df_bva.iloc[i, 3] 
-                year = df_bva.iloc[i, 4]
-                expected = df_bva.iloc[i, 5]
+                day = row['Day']
+                month = row['Month']
+                year = row['Year']
+                expected = row.get('Expected Output')
                 
                 if pd.notna(day) and pd.notna(month) and pd.notna(year):
                     day, month, year = int(day), int(month), int(year)
@@ -70,7 +72,8 @@ def analyze_month_year_boundaries():
     print("-" * 50)
     
     try:
-        df_comprehensive = pd.read_excel('next_date_test_cases.xlsx')
+        if df_comprehensive is None:
+            df_comprehensive = load_workbook_columns('next_date_test_cases.xlsx')
         
         dec_31_cases = []
         month_end_cases = []
@@ -137,7 +140,8 @@ def analyze_month_year_boundaries():
     print("-" * 50)
     
     try:
-        df_gemini = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
+        if df_gemini is None:
+            df_gemini = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
         
         gemini_dec31_cases = []
         gemini_month_ends = []
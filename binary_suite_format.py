@@ -0,0 +1,322 @@
+import argparse
+import struct
+from datetime import date
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+import numpy as np
+import openpyxl
+import pandas as pd
+from suite_cases import Case, format_input_date, format_iso_date, load_suite_records, parse_input_date, save_suite_cases_csv
+
+# File layout (little-endian):
+#   header  : magic, version, flags, reserved, case count, offset of the ID table
+#   inputs  : int32[count]  input ordinals (see encode_input)
+#   expected: int32[count]  expected ordinals, 0 for INVALID, -(1 + YYYYMMDD) for
+#                           expectations that aren't real dates (kept as written)
+#   status  : uint8[count]  result codes (STATUS_CODES)
+#   ids     : optional, uint64[count + 1] byte offsets followed by a UTF-8 blob
+MAGIC = b'NDSUITE1'
+VERSION = 1
+FLAG_HAS_IDS = 1
+HEADER = struct.Struct('<8sHHIQQ')
+
+STATUS_CODES = {None: 0, 'Pass': 1, 'Fail': 2, 'Computed': 3, 'MATCH': 4, 'MISMATCH': 5}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+# Invalid inputs (and expectations that aren't real dates) are packed as
+# -(1 + YYYYMMDD); these bounds keep the fields from
+# bleeding into each other and the result inside int32
+MAX_INVALID_DAY = 99
+MAX_INVALID_MONTH = 99
+MAX_INVALID_YEAR = 99999
+
+BVA_TITLE = 'BOUNDARY VALUE ANALYSIS - NEXT DATE PROBLEM'
+BVA_HEADER = ['S.No', 'Day', 'Month', 'Year', 'Expected Next Date / Result', 'Valid?']
+
+
+def _pack_fields(day: int, month: int, year: int, what: str) -> int:
+    if not (0 <= day <= MAX_INVALID_DAY and 0 <= month <= MAX_INVALID_MONTH and 0 <= year <= MAX_INVALID_YEAR):
+        raise ValueError(f"Cannot encode {what} day={day}, month={month}, year={year}: "
+                         f"invalid dates need 0-{MAX_INVALID_DAY} / 0-{MAX_INVALID_MONTH} / 0-{MAX_INVALID_YEAR}")
+    return -(1 + year * 10000 + month * 100 + day)
+
+
+def _unpack_fields(value: int) -> Tuple[int, int, int]:
+    packed = -value - 1
+    return packed % 100, (packed // 100) % 100, packed // 10000
+
+
+def encode_input(day: int, month: int, year: int) -> int:
+    """
+    Encode an input date as an int32. Valid dates use their proleptic Gregorian
+    ordinal (always >= 1); invalid inputs keep their raw fields as -(1 + YYYYMMDD)
+    so they survive the round trip. Invalid inputs whose fields don't fit that
+    packing (negative, day/month above 99, year above 99999) raise ValueError
+    rather than decoding as some other date.
+    """
+    try:
+        return date(year, month, day).toordinal()
+    except ValueError:
+        return _pack_fields(day, month, year, 'input')
+
+
+def decode_input(value: int) -> Tuple[int, int, int]:
+    """Inverse of encode_input. Returns (day, month, year)."""
+    value = int(value)
+    if value > 0:
+        d = date.fromordinal(value)
+        return d.day, d.month, d.year
+    return _unpack_fields(value)
+
+
+def encode_expected(expected: str) -> int:
+    """
+    Encode an expected output: INVALID as 0, a YYYY-MM-DD date as its ordinal. A
+    YYYY-MM-DD expectation that isn't a real date (a wrong answer such as 2023-02-29)
+    is packed like an invalid input, so the suite keeps what it said. Anything else
+    raises ValueError.
+    """
+    if expected == "INVALID":
+        return 0
+    parsed = parse_input_date(expected)
+    if parsed is None:
+        raise ValueError(f"Cannot encode expected output {expected!r}: need YYYY-MM-DD or INVALID")
+    day, month, year = parsed
+    try:
+        return date(year, month, day).toordinal()
+    except ValueError:
+        return _pack_fields(day, month, year, 'expected output')
+
+
+def decode_expected(value: int) -> str:
+    """Inverse of encode_expected."""
+    value = int(value)
+    if value == 0:
+        return "INVALID"
+    if value < 0:
+        return format_input_date(*_unpack_fields(value))
+    return format_iso_date(date.fromordinal(value))
+
+
+def _as_int32(values, column: str) -> np.ndarray:
+    """Cast to the on-disk int32 column, refusing values that would wrap around."""
+    values = np.asarray(values)
+    if values.size and values.dtype.kind in 'iu':
+        info = np.iinfo(np.int32)
+        if values.min() < info.min or values.max() > info.max:
+            raise ValueError(f"{column} values do not fit the int32 column")
+    return np.ascontiguousarray(values, dtype='<i4')
+
+
+def write_suite_arrays(file_path: str, inputs, expected, status=None, ids: Optional[Sequence[str]] = None):
+    """Write already-encoded column arrays to a binary suite file."""
+    inputs = _as_int32(inputs, 'inputs')
+    expected = _as_int32(expected, 'expected')
+    count = len(inputs)
+    if len(expected) != count:
+        raise ValueError("inputs and expected must have the same length")
+    status = np.zeros(count, dtype='u1') if status is None else np.ascontiguousarray(status, dtype='u1')
+    if len(status) != count:
+        raise ValueError("status must have the same length as inputs")
+    if ids is not None and len(ids) != count:
+        raise ValueError("ids must have the same length as inputs")
+
+    columns_end = HEADER.size + count * 9
+    ids_offset = (columns_end + 7) // 8 * 8 if ids is not None else 0
+    flags = FLAG_HAS_IDS if ids is not None else 0
+
+    with open(file_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, 0, count, ids_offset))
+        f.write(inputs.tobytes())
+        f.write(expected.tobytes())
+        f.write(status.tobytes())
+        if ids is not None:
+            f.write(b'\0' * (ids_offset - columns_end))
+            encoded = [(case_id or '').encode('utf-8') for case_id in ids]
+            offsets = np.zeros(count + 1, dtype='<u8')
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            f.write(offsets.tobytes())
+            f.write(b''.join(encoded))
+
+
+def write_suite(file_path: str, cases: Iterable[Case], statuses: Optional[Sequence[Optional[str]]] = None,
+                ids: Optional[Sequence[str]] = None):
+    """Encode (day, month, year, expected) cases and write them to a binary suite file."""
+    cases = list(cases)
+    inputs = np.fromiter((encode_input(d, m, y) for d, m, y, _ in cases), dtype='<i4', count=len(cases))
+    expected = np.fromiter((encode_expected(e) for _, _, _, e in cases), dtype='<i4', count=len(cases))
+    status = None
+    if statuses is not None:
+        status = np.fromiter((STATUS_CODES.get(s, 0) for s in statuses), dtype='u1', count=len(cases))
+    write_suite_arrays(file_path, inputs, expected, status, ids)
+
+
+class BinarySuite:
+    """
+    Memory-mapped view of a binary suite file. Opening is O(1) regardless of size;
+    inputs/expected/status are numpy memmaps, so slicing them never copies.
+    """
+
+    def __init__(self, file_path: str, mode: str = 'r'):
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{file_path} is too short to be a binary suite")
+        magic, version, flags, _, count, ids_offset = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{file_path} is not a binary suite file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary suite version: {version}")
+
+        self.count = count
+        offset = HEADER.size
+        # numpy cannot map zero-length regions, so empty suites get plain empty arrays
+        if count:
+            self.inputs = np.memmap(file_path, dtype='<i4', mode=mode, offset=offset, shape=(count,))
+            self.expected = np.memmap(file_path, dtype='<i4', mode=mode, offset=offset + 4 * count, shape=(count,))
+            self.status = np.memmap(file_path, dtype='u1', mode=mode, offset=offset + 8 * count, shape=(count,))
+        else:
+            self.inputs = np.zeros(0, dtype='<i4')
+            self.expected = np.zeros(0, dtype='<i4')
+            self.status = np.zeros(0, dtype='u1')
+
+        self._id_offsets = None
+        self._id_blob = None
+        if flags & FLAG_HAS_IDS:
+            self._id_offsets = np.memmap(file_path, dtype='<u8', mode='r', offset=ids_offset, shape=(count + 1,))
+            blob_size = int(self._id_offsets[-1])
+            if blob_size:
+                self._id_blob = np.memmap(file_path, dtype='u1', mode='r',
+                                          offset=ids_offset + 8 * (count + 1), shape=(blob_size,))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def has_ids(self) -> bool:
+        return self._id_offsets is not None
+
+    def case_id(self, index: int) -> Optional[str]:
+        if self._id_offsets is None:
+            return None
+        start, end = int(self._id_offsets[index]), int(self._id_offsets[index + 1])
+        if start == end:
+            return None
+        return bytes(self._id_blob[start:end]).decode('utf-8')
+
+    def status_name(self, index: int) -> Optional[str]:
+        return STATUS_NAMES.get(int(self.status[index]))
+
+    def case(self, index: int) -> Case:
+        return (*decode_input(self.inputs[index]), decode_expected(self.expected[index]))
+
+    def iter_cases(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Case]:
+        """Decode cases in [start, stop) lazily; only the touched pages are read."""
+        stop = self.count if stop is None else min(stop, self.count)
+        for i in range(start, stop):
+            yield self.case(i)
+
+
+def open_suite(file_path: str, mode: str = 'r') -> BinarySuite:
+    """Open a binary suite file via memory mapping. Use mode='r+' to update status in place."""
+    return BinarySuite(file_path, mode)
+
+
+# --- Converters ---
+def convert_to_binary(input_file: str, output_file: str) -> int:
+    """Convert any CSV/XLSX suite layout (including the BVA offset-header layout) to the binary format."""
+    records = load_suite_records(input_file)
+    cases = [case for case, _, _ in records]
+    ids = [case_id for _, case_id, _ in records]
+    statuses = [result for _, _, result in records]
+    write_suite(output_file, cases,
+                statuses if any(statuses) else None,
+                ids if any(ids) else None)
+    return len(cases)
+
+
+def _to_day_first(expected: str, sep: str, invalid: str) -> str:
+    if expected == "INVALID":
+        return invalid
+    year, month, day = expected.split('-')
+    return f"{day}{sep}{month}{sep}{year}"
+
+
+def convert_from_binary(input_file: str, output_file: str, layout: str = 'auto') -> int:
+    """
+    Convert a binary suite back to one of the existing layouts:
+      csv   - input_date,expected_output (gemini_generated_testcases.csv)
+      cases - Test Case ID/Day/Month/Year/Expected Output/Result (Pass/Fail) workbook
+      bva   - offset-header workbook like NextDate_BVA_TestCases.xlsx
+    'auto' picks csv for .csv outputs and cases for .xlsx outputs.
+    """
+    suite = open_suite(input_file)
+    if layout == 'auto':
+        layout = 'csv' if output_file.lower().endswith('.csv') else 'cases'
+
+    if layout == 'csv':
+        save_suite_cases_csv(suite.iter_cases(), output_file)
+    elif layout == 'cases':
+        rows = []
+        for i, (day, month, year, expected) in enumerate(suite.iter_cases()):
+            rows.append({
+                'Test Case ID': suite.case_id(i) or f"TC{i + 1:03d}",
+                'Day': day,
+                'Month': month,
+                'Year': year,
+                # Same DD-MM-YYYY / "Invalid Date" strings fill_actual_results compares against
+                'Expected Output': _to_day_first(expected, '-', 'Invalid Date'),
+                'Result (Pass/Fail)': suite.status_name(i),
+            })
+        pd.DataFrame(rows).to_excel(output_file, index=False)
+    elif layout == 'bva':
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        # Title on row 2 and header on row 4, as in NextDate_BVA_TestCases.xlsx
+        ws.append([])
+        ws.append([None] * 5 + [BVA_TITLE])
+        ws.append([])
+        ws.append([None] + BVA_HEADER)
+        for i, (day, month, year, expected) in enumerate(suite.iter_cases()):
+            case_id = suite.case_id(i)
+            serial_no = int(case_id) if case_id and case_id.isdigit() else i + 1
+            ws.append([None, serial_no, day, month, year,
+                       _to_day_first(expected, '/', 'Invalid'),
+                       'No' if expected == "INVALID" else 'Yes'])
+        wb.save(output_file)
+    else:
+        raise ValueError(f"Unknown layout: {layout}")
+    return len(suite)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binary columnar Next Date test suite format")
+    sub = parser.add_subparsers(dest='command', required=True)
+    to_bin = sub.add_parser('to-binary', help='Convert a CSV/XLSX suite to the binary format')
+    to_bin.add_argument('input')
+    to_bin.add_argument('output')
+    from_bin = sub.add_parser('from-binary', help='Convert a binary suite to CSV/XLSX')
+    from_bin.add_argument('input')
+    from_bin.add_argument('output')
+    from_bin.add_argument('--layout', choices=['auto', 'csv', 'cases', 'bva'], default='auto')
+    info = sub.add_parser('info', help='Show a summary of a binary suite')
+    info.add_argument('input')
+    args = parser.parse_args()
+
+    if args.command == 'to-binary':
+        count = convert_to_binary(args.input, args.output)
+        print(f"Converted {count} test cases to: {args.output}")
+    elif args.command == 'from-binary':
+        count = convert_from_binary(args.input, args.output, args.layout)
+        print(f"Converted {count} test cases to: {args.output}")
+    else:
+        suite = open_suite(args.input)
+        print(f"Test cases: {len(suite)}")
+        print(f"Has IDs: {suite.has_ids}")
+        print(f"Invalid inputs: {int((suite.inputs < 0).sum())}")
+        for i, (day, month, year, expected) in enumerate(suite.iter_cases(0, 5)):
+            print(f"{suite.case_id(i) or i}: {format_input_date(day, month, year)} -> {expected}")
+
+
+if __name__ == "__main__":
+    main()
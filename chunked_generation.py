@@ -0,0 +1,183 @@
+import argparse
+import csv
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from providers import GeminiProvider, MockProvider, TestCaseProvider, build_prompt
+from suite_cases import format_input_date, normalize_expected, oracle_expected, parse_input_date
+
+# Rough token costs used for budgeting: one "YYYY-MM-DD,YYYY-MM-DD" line is ~12 tokens
+TOKENS_PER_CASE = 12
+CHARS_PER_TOKEN = 4
+
+# Each chunk's prompt is steered toward one of these boundary classes in turn
+# (the same classes the leap-year and month/year analyses and the minimizer use)
+FOCUS_CLASSES = [
+    "leap-year February 28 and 29 across many different leap years",
+    "non-leap February 28 and invalid February 29 across many different years",
+    "century years such as 1700, 1800, 1900, 2000, 2100 and 2400",
+    "December 31 year rollover across many different years",
+    "last day of 30-day months (April, June, September, November)",
+    "last day of 31-day months other than December",
+    "invalid days: day 0, day 32 and day 31 in 30-day months",
+    "invalid months: month 0 and month 13",
+    "minimum and maximum supported years (0001 and 9999)",
+    "ordinary mid-month dates spread over many years",
+]
+
+# Stop after this many calls in a row return no cases at all (provider down, quota used up)
+MAX_EMPTY_RESPONSES = 3
+
+
+def estimate_tokens(num_cases: int, focus: Optional[str] = None) -> int:
+    """Estimated prompt + response tokens for one chunk request."""
+    return len(build_prompt(num_cases, focus)) // CHARS_PER_TOKEN + num_cases * TOKENS_PER_CASE
+
+
+def plan_chunk_size(max_chunk_cases: int, max_output_tokens: int) -> int:
+    """Largest chunk that fits the model's output limit, keeping 20% headroom for chatter."""
+    return max(1, min(max_chunk_cases, int(max_output_tokens * 0.8) // TOKENS_PER_CASE))
+
+
+def generate_unique_cases(provider: TestCaseProvider, num_cases: int, chunk_size: int = 100,
+                          max_requests: int = 100, token_budget: Optional[int] = None,
+                          keep_wrong: bool = False) -> Dict:
+    """
+    Request cases chunk by chunk until num_cases unique, oracle-correct cases exist or the
+    request/token budget runs out. Returns the accepted cases, the cases whose expectation
+    disagreed with the local oracle (input, model expectation, oracle expectation), stats
+    and the reason generation stopped. With keep_wrong=True, wrong cases are kept in the
+    suite with the oracle's answer instead of being discarded; otherwise an input answered
+    wrongly can still be accepted when a later chunk answers it correctly.
+    """
+    seen = set()        # accepted inputs
+    wrong_seen = set()  # inputs answered wrongly and not (yet) accepted
+    accepted: List[Tuple[str, str]] = []
+    wrong: List[Tuple[str, str, str]] = []
+    stats = {"requests": 0, "tokens": 0, "returned": 0, "duplicates": 0,
+             "malformed": 0, "wrong": 0, "accepted": 0}
+    stop_reason = f"request limit reached ({max_requests} calls)"
+    empty_in_a_row = 0
+
+    while len(accepted) < num_cases and stats["requests"] < max_requests:
+        focus = FOCUS_CLASSES[stats["requests"] % len(FOCUS_CLASSES)]
+        # Over-ask by the observed loss to duplicates, bad lines and wrong answers so far,
+        # so the tail of the run doesn't trickle in a few cases per call
+        usable = len(accepted) / stats["returned"] if stats["returned"] else 0.9
+        missing = num_cases - len(accepted)
+        request_size = min(chunk_size, math.ceil(missing / max(usable, 0.1)))
+        cost = estimate_tokens(request_size, focus)
+        if token_budget is not None and stats["tokens"] + cost > token_budget:
+            stop_reason = f"token budget reached ({stats['tokens']}/{token_budget})"
+            break
+
+        cases, rejected = provider.generate_with_rejects(request_size, focus)
+        stats["requests"] += 1
+        stats["tokens"] += cost
+        stats["returned"] += len(cases)
+        stats["malformed"] += len(rejected)
+        empty_in_a_row = 0 if cases or rejected else empty_in_a_row + 1
+        if empty_in_a_row >= MAX_EMPTY_RESPONSES:
+            stop_reason = f"{provider.name} returned no cases {empty_in_a_row} times in a row"
+            break
+
+        for inp, out in cases:
+            parsed = parse_input_date(inp)
+            if parsed is None:
+                stats["malformed"] += 1
+                continue
+            day, month, year = parsed
+            key = format_input_date(day, month, year)
+            if key in seen:
+                stats["duplicates"] += 1
+                continue
+
+            expected = normalize_expected(out)
+            oracle = oracle_expected(day, month, year)
+            if expected != oracle:
+                if key in wrong_seen:
+                    stats["duplicates"] += 1
+                    continue
+                stats["wrong"] += 1
+                wrong.append((key, expected, oracle))
+                if not keep_wrong:
+                    wrong_seen.add(key)
+                    continue
+            seen.add(key)
+            accepted.append((key, oracle))
+            if len(accepted) == num_cases:
+                break
+
+    if len(accepted) == num_cases:
+        stop_reason = "all requested cases generated"
+    stats["accepted"] = len(accepted)
+    stats["yield_per_call"] = len(accepted) / stats["requests"] if stats["requests"] else 0.0
+    return {"cases": accepted, "wrong": wrong, "stats": stats, "stop_reason": stop_reason}
+
+
+def print_generation_report(result: Dict, num_cases: int):
+    stats = result["stats"]
+    print("=== CHUNKED GENERATION SUMMARY ===")
+    print(f"Requested unique cases: {num_cases}")
+    print(f"Accepted cases: {stats['accepted']}")
+    print(f"Stopped because: {result['stop_reason']}")
+    print(f"API calls: {stats['requests']}")
+    print(f"Estimated tokens: {stats['tokens']}")
+    print(f"Cases returned: {stats['returned']}")
+    print(f"Duplicates dropped: {stats['duplicates']}")
+    print(f"Malformed lines: {stats['malformed']}")
+    print(f"Wrong expectations (vs local oracle): {stats['wrong']}")
+    print(f"Yield per API call: {stats['yield_per_call']:.1f} unique correct cases")
+    if result["wrong"]:
+        print(f"\n=== SAMPLE WRONG EXPECTATIONS (showing first 5) ===")
+        for i, (inp, expected, oracle) in enumerate(result["wrong"][:5]):
+            print(f"{i+1}. Input: {inp} | Model: {expected} | Oracle: {oracle}")
+
+
+def save_wrong_cases(wrong: List[Tuple[str, str, str]], filename: str):
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['input', 'model_output', 'oracle_output'])
+        writer.writerows(wrong)
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Chunked large-N Next Date test case generation")
+    parser.add_argument('--generate', type=int, default=1000, help='Number of unique, correct cases wanted')
+    parser.add_argument('--provider', choices=['gemini', 'mock'], default='gemini', help='Backend to query')
+    parser.add_argument('--api-key', type=str, help='Gemini API key (or set GEMINI_API_KEY in .env)')
+    parser.add_argument('--chunk-size', type=int, default=200, help='Maximum cases requested per API call')
+    parser.add_argument('--max-output-tokens', type=int, default=8192, help="Model's output token limit per call")
+    parser.add_argument('--max-requests', type=int, default=100, help='Maximum number of API calls')
+    parser.add_argument('--token-budget', type=int, help='Maximum estimated tokens across all calls')
+    parser.add_argument('--keep-wrong', action='store_true', help='Keep cases with wrong expectations, corrected by the oracle')
+    parser.add_argument('--output', type=str, help='Where to save the cases (default: <provider>_generated_testcases.csv)')
+    args = parser.parse_args()
+    output = args.output or f"{args.provider}_generated_testcases.csv"
+
+    if args.provider == 'gemini':
+        api_key = args.api_key or os.environ.get('GEMINI_API_KEY')
+        if not api_key:
+            print("Gemini API key required. Use --api-key or set GEMINI_API_KEY in .env file.")
+            return
+        provider = GeminiProvider(api_key)
+    else:
+        provider = MockProvider()
+
+    chunk_size = plan_chunk_size(args.chunk_size, args.max_output_tokens)
+    result = generate_unique_cases(provider, args.generate, chunk_size, args.max_requests,
+                                   args.token_budget, args.keep_wrong)
+    print_generation_report(result, args.generate)
+
+    with open(output, 'w', newline='') as f:
+        csv.writer(f).writerows(result["cases"])
+    print(f"\nGenerated test cases saved to: {output}")
+    if result["wrong"]:
+        save_wrong_cases(result["wrong"], 'flagged_wrong_expectations.csv')
+        print("Wrong expectations saved to: flagged_wrong_expectations.csv")
+
+
+if __name__ == "__main__":
+    main()
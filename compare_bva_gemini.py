@@ -1,28 +1,29 @@
 import pandas as pd
 from datetime import datetime, date, timedelta
+from excel_schema import load_workbook_columns
 
-def parse_bva_file():
-    """Parse the NextDate_BVA_TestCases.xlsx file to extract test cases"""
-    df = pd.read_excel('NextDate_BVA_TestCases.xlsx')
+BVA_COLUMNS = ['Test Case ID', 'Day', 'Month', 'Year', 'Expected Output', 'Valid?']
+
+def parse_bva_file(file_path='NextDate_BVA_TestCases.xlsx', df=None):
+    """Parse the NextDate_BVA_TestCases.xlsx file (or a workbook with the same layout) to extract test cases"""
+    # Header row and columns are detected from the workbook, not assumed
+    if df is None:
+        df = load_workbook_columns(file_path, BVA_COLUMNS)
     
     test_cases = []
     
-    # Start from row 3 (index 3) where actual data begins
-    for index, row in df.iterrows():
-        if index < 3:  # Skip header rows
-            continue
-            
+    for _, row in df.iterrows():
         try:
-            # Extract data from the specific columns
-            serial_no = row.iloc[1] if pd.notna(row.iloc[1]) else None
-            day = row.iloc[2] if pd.notna(row.iloc[2]) else None
-            month = row.iloc[3] if pd.notna(row.iloc[3]) else None
-            year = row.iloc[4] if pd.notna(row.iloc[4]) else None
-            expected = row.iloc[5] if pd.notna(row.iloc[5]) else None
-            valid = row.iloc[6] if pd.notna(row.iloc[6]) else None
+            # Extract data from the named columns
+            serial_no = row.get('Test Case ID') if pd.notna(row.get('Test Case ID')) else None
+            day = row['Day'] if pd.notna(row['Day']) else None
+            month = row['Month'] if pd.notna(row['Month']) else None
+            year = row['Year'] if pd.notna(row['Year']) else None
+            expected = row.get('Expected Output') if pd.notna(row.get('Expected Output')) else None
+            valid = row.get('Valid?') if pd.notna(row.get('Valid?')) else None
             
-            # Skip rows without complete data
-            if not all([serial_no, day, month, year, expected]):
+            # Skip rows without complete data (Day 0 / Month 0 are boundary cases, not missing)
+            if any(value is None for value in (serial_no, day, month, year, expected)):
                 continue
                 
             # Convert to proper format
@@ -61,12 +62,13 @@ def parse_bva_file():
     
     return test_cases
 
-def compare_bva_with_gemini():
+def compare_bva_with_gemini(bva_cases=None, gemini_df=None, output_file='bva_gemini_comparison.csv'):
     print("=== COMPARING NextDate_BVA_TestCases.xlsx WITH GEMINI GENERATED TEST CASES ===\n")
     
-    # Parse BVA test cases
+    # Parse BVA test cases unless already parsed
     try:
-        bva_cases = parse_bva_file()
+        if bva_cases is None:
+            bva_cases = parse_bva_file()
         print(f"Loaded BVA test cases: {len(bva_cases)} test cases")
     except FileNotFoundError:
         print("Error: NextDate_BVA_TestCases.xlsx not found")
@@ -75,9 +77,10 @@ def compare_bva_with_gemini():
         print(f"Error parsing BVA file: {e}")
         return
     
-    # Read Gemini generated test cases
+    # Read Gemini generated test cases unless already loaded
     try:
-        gemini_df = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
+        if gemini_df is None:
+            gemini_df = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
         print(f"Loaded Gemini test cases: {len(gemini_df)} test cases\n")
     except FileNotFoundError:
         print("Error: gemini_generated_testcases.csv not found")
@@ -182,11 +185,13 @@ def compare_bva_with_gemini():
     
     # Save detailed results
     all_results = positive_cases + negative_cases + bva_only_cases + gemini_only_cases
-    if all_results:
+    if all_results and output_file:
         results_df = pd.DataFrame(all_results)
-        results_df.to_csv('bva_gemini_comparison.csv', index=False)
+        results_df.to_csv(output_file, index=False)
         print(f"\n=== DETAILED RESULTS SAVED ===")
-        print("Detailed comparison saved to: bva_gemini_comparison.csv")
+        print(f"Detailed comparison saved to: {output_file}")
+
+    return all_results
 
 if __name__ == "__main__":
     compare_bva_with_gemini()
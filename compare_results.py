@@ -1,20 +1,23 @@
 import pandas as pd
+from excel_schema import load_workbook_columns
 from datetime import datetime
 
-def compare_results():
+def compare_results(final_results=None, gemini_cases=None, output_file='detailed_comparison_results.csv'):
     print("=== COMPARING FINAL RESULTS WITH GEMINI GENERATED TEST CASES ===\n")
     
-    # Read the final results (Excel)
+    # Read the final results (Excel) unless already loaded
     try:
-        final_results = pd.read_excel('next_date_final_with_results.xlsx')
+        if final_results is None:
+            final_results = load_workbook_columns('next_date_final_with_results.xlsx', ['Day', 'Month', 'Year', 'Actual Output'])
         print(f"Loaded final results: {len(final_results)} test cases")
     except FileNotFoundError:
         print("Error: next_date_final_with_results.xlsx not found")
         return
     
-    # Read Gemini generated test cases (CSV)
+    # Read Gemini generated test cases (CSV) unless already loaded
     try:
-        gemini_cases = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
+        if gemini_cases is None:
+            gemini_cases = pd.read_csv('gemini_generated_testcases.csv', header=None, names=['input_date', 'expected_output'])
         print(f"Loaded Gemini test cases: {len(gemini_cases)} test cases\n")
     except FileNotFoundError:
         print("Error: gemini_generated_testcases.csv not found")
@@ -73,8 +76,8 @@ def compare_results():
             })
     
     # Check for cases only in final results
+    gemini_inputs = set(gemini_cases['input_date'].str.strip())
     for input_date, final_output in final_dict.items():
-        gemini_inputs = set(gemini_cases['input_date'].str.strip())
         if input_date not in gemini_inputs:
             final_only_cases.append({
                 'input': input_date,
@@ -117,11 +120,13 @@ def compare_results():
     
     # Save detailed comparison to file
     all_comparisons = positive_cases + negative_cases + gemini_only_cases + final_only_cases
-    if all_comparisons:
+    if all_comparisons and output_file:
         comparison_df = pd.DataFrame(all_comparisons)
-        comparison_df.to_csv('detailed_comparison_results.csv', index=False)
+        comparison_df.to_csv(output_file, index=False)
         print(f"\n=== DETAILED COMPARISON SAVED ===")
-        print("Detailed comparison saved to: detailed_comparison_results.csv")
+        print(f"Detailed comparison saved to: {output_file}")
+
+    return all_comparisons
 
 if __name__ == "__main__":
     compare_results()
@@ -0,0 +1,150 @@
+import os
+from typing import Dict, List, Optional, Sequence
+import openpyxl
+import pandas as pd
+
+# Canonical column names (the ones the named-column scripts already use) and the
+# header texts that map to each, compared case-insensitively. Exact matches win
+# over prefix matches, so "Expected Next Date / Result" is Expected Output, not Result.
+COLUMN_ROLES = {
+    'Test Case ID': {'exact': ['test case id', 's.no', 's. no', 'serial no', 'tc id', 'id'], 'prefix': ['test case']},
+    'testing': {'exact': ['testing', 'test type'], 'prefix': []},
+    'Day': {'exact': ['day', 'dd'], 'prefix': []},
+    'Month': {'exact': ['month', 'mm'], 'prefix': []},
+    'Year': {'exact': ['year', 'yyyy'], 'prefix': []},
+    'Expected Output': {'exact': ['expected output', 'expected'], 'prefix': ['expected']},
+    'Valid?': {'exact': ['valid?', 'valid'], 'prefix': []},
+    'Boundary Type': {'exact': ['boundary type'], 'prefix': []},
+    'Actual Output': {'exact': ['actual output', 'actual'], 'prefix': ['actual']},
+    'Result (Pass/Fail)': {'exact': ['result (pass/fail)', 'result'], 'prefix': ['result']},
+}
+REQUIRED_ROLES = ('Day', 'Month', 'Year')
+HEADER_SEARCH_ROWS = 30
+
+# (absolute path, sheet) -> (mtime_ns, size, schema)
+_SCHEMA_CACHE: Dict[tuple, tuple] = {}
+
+
+def _header_text(header) -> str:
+    return ' '.join(str(header).split()).lower()
+
+
+def match_role(header) -> Optional[str]:
+    """Map a header cell to its canonical column name, or None if it isn't a known role."""
+    if header is None:
+        return None
+    text = _header_text(header)
+    for role, names in COLUMN_ROLES.items():
+        if text in names['exact']:
+            return role
+    for role, names in COLUMN_ROLES.items():
+        if any(text.startswith(prefix) for prefix in names['prefix']):
+            return role
+    return None
+
+
+def assign_roles(headers: Sequence) -> Dict[str, int]:
+    """
+    Map each role to the index of the first header that has it. Prefix matches only
+    apply to headers that aren't an exact match for some role, and only to roles no
+    header matches exactly, so "Result notes" next to "Result" stays a plain column.
+    """
+    texts = [_header_text(h) if h is not None and str(h).strip() != '' else None for h in headers]
+    roles: Dict[str, int] = {}
+    exact_rows = set()
+    for index, text in enumerate(texts):
+        for role, names in COLUMN_ROLES.items():
+            if text is not None and text in names['exact']:
+                roles.setdefault(role, index)
+                exact_rows.add(index)
+                break
+    exact_roles = set(roles)
+    for index, text in enumerate(texts):
+        if text is None or index in exact_rows:
+            continue
+        for role, names in COLUMN_ROLES.items():
+            if role not in exact_roles and any(text.startswith(prefix) for prefix in names['prefix']):
+                roles.setdefault(role, index)
+                break
+    return roles
+
+
+def role_headers(headers: Sequence) -> Dict[str, str]:
+    """{canonical name: header} for a loaded DataFrame's columns, e.g. {'Expected Output': 'Expected'}."""
+    headers = list(headers)
+    return {role: headers[index] for role, index in assign_roles(headers).items()}
+
+
+def _detect_schema(file_path: str, sheet: Optional[str]) -> Dict:
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.active
+        for row_number, row in enumerate(ws.iter_rows(max_row=HEADER_SEARCH_ROWS, values_only=True), start=1):
+            roles = {role: index + 1 for role, index in assign_roles(row).items()}
+            if not all(role in roles for role in REQUIRED_ROLES):
+                continue
+            columns = {}
+            for col_number, value in enumerate(row, start=1):
+                if value is None or str(value).strip() == '':
+                    # Named like pandas does, so full-width loads keep blank-header columns
+                    name = f"Unnamed: {col_number - 1}"
+                else:
+                    name = base = str(value).strip()
+                    repeat = 1
+                    while name in columns:  # repeated headers become "Expected.1", as in pandas
+                        name = f"{base}.{repeat}"
+                        repeat += 1
+                columns[name] = col_number
+            return {'sheet': ws.title, 'header_row': row_number, 'roles': roles, 'columns': columns}
+    finally:
+        wb.close()
+    raise ValueError(f"No header row with Day, Month and Year found in the first {HEADER_SEARCH_ROWS} rows of {file_path}")
+
+
+def detect_schema(file_path: str, sheet: Optional[str] = None) -> Dict:
+    """
+    Find the header row and column positions of a workbook. Returns
+    {'sheet', 'header_row', 'roles': {canonical name: column}, 'columns': {header: column}}
+    where columns has every header under its own text, repeats as 'Header.1' and blanks
+    as 'Unnamed: N' (as pandas names them). Cached per file until it is modified.
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), sheet)
+    cached = _SCHEMA_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    schema = _detect_schema(file_path, sheet)
+    _SCHEMA_CACHE[key] = (stat.st_mtime_ns, stat.st_size, schema)
+    return schema
+
+
+def load_workbook_columns(file_path: str, columns: Optional[List[str]] = None, sheet: Optional[str] = None) -> pd.DataFrame:
+    """
+    Load a test-case workbook through its detected schema. Without `columns`, every column
+    comes back under its own header text (use role_headers to find Day, Expected Output, ...).
+    With `columns`, only those are read: canonical names (Day, Month, Year, Expected Output,
+    ...) are found by role whatever the header text and position and come back under the
+    canonical name, other names by header text; missing ones are skipped.
+    Uses openpyxl's read-only streaming mode and stops reading each row at the last
+    projected column. Rows that are empty in every projected column are dropped.
+    """
+    schema = detect_schema(file_path, sheet)
+    if columns is None:
+        available = schema['columns']
+    else:
+        available = {**schema['columns'], **schema['roles']}
+    wanted = [name for name in (columns or list(available)) if name in available]
+    positions = [available[name] - 1 for name in wanted]
+    max_col = max(positions) + 1 if positions else 1
+
+    rows = []
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[schema['sheet']]
+        for row in ws.iter_rows(min_row=schema['header_row'] + 1, max_col=max_col, values_only=True):
+            values = [row[p] if p < len(row) else None for p in positions]
+            if any(v is not None and str(v).strip() != '' for v in values):
+                rows.append(values)
+    finally:
+        wb.close()
+    return pd.DataFrame(rows, columns=wanted)
@@ -0,0 +1,152 @@
+import argparse
+import os
+from typing import Dict, List
+from analyze_month_year_boundaries import get_max_day, is_leap_year
+from suite_cases import Case, load_suite_cases, save_suite_cases_csv
+
+# Boundary classes taken from the leap-year and month/year boundary analyses.
+# Each class is one bit, so a case's coverage is a single int bitset.
+BOUNDARY_CLASSES = (
+    ['valid_date', 'invalid_date',
+     'min_day', 'nominal_day', 'day_below_min', 'day_above_month_max',
+     'month_below_min', 'month_above_max',
+     'year_lower_bound', 'year_below_min', 'year_upper_bound', 'year_above_max',
+     'leap_feb_28', 'leap_feb_29', 'non_leap_feb_28', 'non_leap_feb_29',
+     'century_leap_year', 'century_non_leap_year', 'year_rollover_dec_31']
+    + [f'month_end_{month:02d}' for month in range(1, 13)]
+)
+CLASS_BITS = {name: 1 << i for i, name in enumerate(BOUNDARY_CLASSES)}
+
+DEFAULT_SUITES = [
+    'NextDate_BVA_TestCases.xlsx',
+    'manual_TestCases.xlsx',
+    'next_date_test_cases.xlsx',
+    'gemini_generated_testcases.csv',
+]
+
+
+def classify_case(day: int, month: int, year: int) -> int:
+    """Return the bitset of boundary classes a single input date exercises."""
+    mask = 0
+    if year < 1:
+        mask |= CLASS_BITS['year_below_min']
+    elif year == 1:
+        mask |= CLASS_BITS['year_lower_bound']
+    elif year == 9999:
+        mask |= CLASS_BITS['year_upper_bound']
+    elif year > 9999:
+        mask |= CLASS_BITS['year_above_max']
+
+    if year % 100 == 0:
+        mask |= CLASS_BITS['century_leap_year' if is_leap_year(year) else 'century_non_leap_year']
+
+    if month < 1:
+        return mask | CLASS_BITS['month_below_min'] | CLASS_BITS['invalid_date']
+    if month > 12:
+        return mask | CLASS_BITS['month_above_max'] | CLASS_BITS['invalid_date']
+
+    max_day = get_max_day(month, year)
+    if day < 1:
+        mask |= CLASS_BITS['day_below_min']
+    elif day > max_day:
+        mask |= CLASS_BITS['day_above_month_max']
+    elif day == 1:
+        mask |= CLASS_BITS['min_day']
+    elif day < max_day:
+        mask |= CLASS_BITS['nominal_day']
+
+    if month == 2 and day in (28, 29):
+        prefix = 'leap' if is_leap_year(year) else 'non_leap'
+        mask |= CLASS_BITS[f'{prefix}_feb_{day}']
+
+    if 1 <= day <= max_day and 1 <= year <= 9999:
+        mask |= CLASS_BITS['valid_date']
+        if day == max_day:
+            mask |= CLASS_BITS[f'month_end_{month:02d}']
+            if month == 12:
+                mask |= CLASS_BITS['year_rollover_dec_31']
+    else:
+        mask |= CLASS_BITS['invalid_date']
+    return mask
+
+
+def class_names(mask: int) -> List[str]:
+    """Expand a class bitset back into class names."""
+    return [name for name, bit in CLASS_BITS.items() if mask & bit]
+
+
+def greedy_set_cover(masks: List[int]) -> List[int]:
+    """
+    Pick a near-minimal list of indices into masks whose union covers every class
+    any mask covers. Candidates are grouped by distinct bitset first, so the greedy
+    loop only ever scans the (small) set of distinct masks, not every case.
+    """
+    first_index: Dict[int, int] = {}
+    for i, mask in enumerate(masks):
+        if mask and mask not in first_index:
+            first_index[mask] = i
+
+    uncovered = 0
+    for mask in first_index:
+        uncovered |= mask
+
+    selected = []
+    while uncovered:
+        # Most newly covered classes wins; ties go to the case seen first
+        best = max(first_index, key=lambda m: ((m & uncovered).bit_count(), -first_index[m]))
+        selected.append(first_index[best])
+        uncovered &= ~best
+    return sorted(selected)
+
+
+def minimize_suite(cases: List[Case]) -> List[Case]:
+    """Reduce cases to a near-minimal subset covering the same boundary classes."""
+    masks = [classify_case(day, month, year) for day, month, year, _ in cases]
+    return [cases[i] for i in greedy_set_cover(masks)]
+
+
+def minimize_suites(input_files: List[str], output_file: str) -> Dict[str, float]:
+    print("=== TEST SUITE MINIMIZATION ===\n")
+
+    # Merge every suite, keeping the first occurrence of each input date
+    merged = []
+    seen = set()
+    for file_path in input_files:
+        if not os.path.exists(file_path):
+            print(f"Skipping missing suite: {file_path}")
+            continue
+        cases = load_suite_cases(file_path)
+        print(f"Loaded {file_path}: {len(cases)} test cases")
+        for case in cases:
+            key = case[:3]
+            if key not in seen:
+                seen.add(key)
+                merged.append(case)
+
+    minimized = minimize_suite(merged)
+    covered = 0
+    for day, month, year, _ in minimized:
+        covered |= classify_case(day, month, year)
+
+    save_suite_cases_csv(minimized, output_file)
+
+    reduction = len(merged) / len(minimized) if minimized else 0.0
+    print(f"\n=== MINIMIZATION SUMMARY ===")
+    print(f"Unique input cases: {len(merged)}")
+    print(f"Minimized cases: {len(minimized)}")
+    print(f"Boundary classes covered: {covered.bit_count()}/{len(BOUNDARY_CLASSES)}")
+    print(f"Reduction factor: {reduction:.1f}x")
+    missing = [name for name in BOUNDARY_CLASSES if not covered & CLASS_BITS[name]]
+    if missing:
+        print(f"Classes not covered by any input suite: {', '.join(missing)}")
+    print(f"Minimized suite saved to: {output_file}")
+
+    return {"original": len(merged), "minimized": len(minimized), "reduction_factor": reduction}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minimize merged Next Date test suites by boundary-class coverage")
+    parser.add_argument('inputs', nargs='*', default=DEFAULT_SUITES, help='Suite files (CSV/XLSX) to merge')
+    parser.add_argument('--output', type=str, default='minimized_testcases.csv', help='Where to write the reduced suite')
+    args = parser.parse_args()
+    minimize_suites(args.inputs, args.output)
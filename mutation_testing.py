@@ -0,0 +1,236 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from binary_suite_format import open_suite
+from suite_cases import load_suite_cases
+
+# Mutants of the next-date logic, each a named set of faults injected into the
+# vectorized implementation below. 'original' carries no fault and must survive.
+MUTANTS = {
+    'original': set(),
+    'every_year_leap': {'every_year_leap'},
+    'no_leap_years': {'no_leap_years'},
+    'century_rule_missing': {'century_rule_missing'},
+    'no_400_year_rule': {'no_400_year_rule'},
+    'feb_max_off_by_one': {'feb_max_off_by_one'},
+    '30_day_months_have_31': {'30_day_months_have_31'},
+    '31_day_months_have_30': {'31_day_months_have_30'},
+    'missing_dec31_rollover': {'missing_dec31_rollover'},
+    'year_not_incremented': {'year_not_incremented'},
+    'month_end_not_rolled': {'month_end_not_rolled'},
+    'day_zero_accepted': {'day_zero_accepted'},
+    'month_13_accepted': {'month_13_accepted'},
+    'month_zero_accepted': {'month_zero_accepted'},
+    'year_zero_accepted': {'year_zero_accepted'},
+    'max_year_overflow_accepted': {'max_year_overflow_accepted'},
+}
+
+DAYS_IN_MONTH = np.array([31, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 31], dtype=np.int64)
+THIRTY_DAY_MONTHS = np.array([False, False, False, False, True, False, True, False, False, True, False, True, False, False])
+
+INVALID = 0
+DEFAULT_SUITES = [
+    'NextDate_BVA_TestCases.xlsx',
+    'manual_TestCases.xlsx',
+    'gemini_generated_testcases.csv',
+    'minimized_testcases.csv',
+]
+CHUNK_SIZE = 1 << 16
+
+
+def mutant_next_date(day: np.ndarray, month: np.ndarray, year: np.ndarray, faults: frozenset) -> np.ndarray:
+    """
+    Vectorized next date with optional injected faults. Returns packed YYYYMMDD
+    results, INVALID (0) where the (mutated) implementation rejects the input.
+    """
+    if 'every_year_leap' in faults:
+        leap = np.ones_like(year, dtype=bool)
+    elif 'no_leap_years' in faults:
+        leap = np.zeros_like(year, dtype=bool)
+    elif 'century_rule_missing' in faults:
+        leap = year % 4 == 0
+    elif 'no_400_year_rule' in faults:
+        leap = (year % 4 == 0) & (year % 100 != 0)
+    else:
+        leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+
+    month_index = np.clip(month, 0, 13)
+    max_day = DAYS_IN_MONTH[month_index] + ((month == 2) & leap)
+    if 'feb_max_off_by_one' in faults:
+        max_day = max_day + (month == 2)
+    if '30_day_months_have_31' in faults:
+        max_day = max_day + THIRTY_DAY_MONTHS[month_index]
+    if '31_day_months_have_30' in faults:
+        max_day = max_day - (DAYS_IN_MONTH[month_index] == 31)
+
+    min_day = 0 if 'day_zero_accepted' in faults else 1
+    min_month = 0 if 'month_zero_accepted' in faults else 1
+    max_month = 13 if 'month_13_accepted' in faults else 12
+    min_year = 0 if 'year_zero_accepted' in faults else 1
+    valid = ((day >= min_day) & (day <= max_day) & (month >= min_month) & (month <= max_month)
+             & (year >= min_year) & (year <= 9999))
+
+    at_month_end = day == max_day
+    if 'month_end_not_rolled' in faults:
+        at_month_end = at_month_end & (month == 12)
+    at_year_end = at_month_end & (month >= 12)
+    if 'missing_dec31_rollover' in faults:
+        at_month_end = at_month_end & ~at_year_end
+        at_year_end = np.zeros_like(at_year_end)
+
+    next_day = np.where(at_month_end, 1, day + 1)
+    next_month = np.where(at_year_end, 1, np.where(at_month_end, month + 1, month))
+    next_year = year + at_year_end if 'year_not_incremented' not in faults else year
+
+    # 31-12-9999 has no representable next date; the oracle reports it as invalid
+    if 'max_year_overflow_accepted' not in faults:
+        valid = valid & (next_year <= 9999)
+    return np.where(valid, next_year * 10000 + next_month * 100 + next_day, INVALID)
+
+
+def pack_expected(expected: str) -> int:
+    if expected == "INVALID":
+        return INVALID
+    try:
+        year, month, day = (int(part) for part in expected.split('-'))
+    except ValueError:
+        return -1  # unparseable expectation: can never match, dropped by the baseline filter
+    return year * 10000 + month * 100 + day
+
+
+def decode_suite_arrays(inputs, expected) -> Dict[str, np.ndarray]:
+    """Decode binary-format input/expected ordinals (or a slice of them) into int64 column arrays."""
+    inputs = np.asarray(inputs, dtype=np.int64)
+    expected = np.asarray(expected, dtype=np.int64)
+    packed = np.where(inputs > 0, 0, -inputs - 1)
+    days = (np.where(inputs > 0, inputs, 1) - 719163).astype('datetime64[D]')
+    valid_input = inputs > 0
+    year = np.where(valid_input, days.astype('datetime64[Y]').astype(np.int64) + 1970, packed // 10000)
+    month = np.where(valid_input, days.astype('datetime64[M]').astype(np.int64) % 12 + 1, packed // 100 % 100)
+    day = np.where(valid_input, (days - days.astype('datetime64[M]')).astype(np.int64) + 1, packed % 100)
+    exp_days = (np.where(expected > 0, expected, 1) - 719163).astype('datetime64[D]')
+    exp_packed = ((exp_days.astype('datetime64[Y]').astype(np.int64) + 1970) * 10000
+                  + (exp_days.astype('datetime64[M]').astype(np.int64) % 12 + 1) * 100
+                  + (exp_days - exp_days.astype('datetime64[M]')).astype(np.int64) + 1)
+    # Negative expectations are packed YYYYMMDD answers that aren't real dates
+    exp_packed = np.where(expected > 0, exp_packed, np.where(expected < 0, -expected - 1, INVALID))
+    return {'day': day, 'month': month, 'year': year, 'expected': exp_packed}
+
+
+def load_suite_arrays(file_path: str) -> Dict[str, np.ndarray]:
+    """Load any suite (CSV/XLSX via suite_cases, or the binary format) into int64 column arrays."""
+    if file_path.lower().endswith('.nds'):
+        suite = open_suite(file_path)
+        return decode_suite_arrays(suite.inputs, suite.expected)
+
+    cases = load_suite_cases(file_path)
+    return {
+        'day': np.array([c[0] for c in cases], dtype=np.int64),
+        'month': np.array([c[1] for c in cases], dtype=np.int64),
+        'year': np.array([c[2] for c in cases], dtype=np.int64),
+        'expected': np.array([pack_expected(c[3]) for c in cases], dtype=np.int64),
+    }
+
+
+def baseline_filter(arrays: Dict[str, np.ndarray]) -> Tuple[Dict[str, np.ndarray], int]:
+    """Keep only cases the unmutated implementation passes; a test that fails on the original kills nothing meaningful."""
+    passes = mutant_next_date(arrays['day'], arrays['month'], arrays['year'], frozenset()) == arrays['expected']
+    return {key: value[passes] for key, value in arrays.items()}, int((~passes).sum())
+
+
+# Worker state: suites are shipped once per worker process, not once per task
+_SUITES: Dict[str, Dict[str, np.ndarray]] = {}
+
+
+def _init_worker(suites: Dict[str, Dict[str, np.ndarray]]):
+    global _SUITES
+    _SUITES = suites
+
+
+def _run_mutant(suite_name: str, mutant_name: str, chunk_size: int = CHUNK_SIZE) -> Tuple[str, str, Optional[int]]:
+    """Evaluate one mutant against one suite chunk by chunk; return the index of the first killing case, if any."""
+    arrays = _SUITES[suite_name]
+    faults = frozenset(MUTANTS[mutant_name])
+    for start in range(0, len(arrays['day']), chunk_size):
+        stop = start + chunk_size
+        actual = mutant_next_date(arrays['day'][start:stop], arrays['month'][start:stop],
+                                  arrays['year'][start:stop], faults)
+        mismatches = np.flatnonzero(actual != arrays['expected'][start:stop])
+        if len(mismatches):
+            return suite_name, mutant_name, start + int(mismatches[0])
+    return suite_name, mutant_name, None
+
+
+def run_mutation_analysis(suite_files: List[str], mutants: Optional[List[str]] = None,
+                          workers: Optional[int] = None) -> pd.DataFrame:
+    """Run every mutant against every suite in a process pool; returns the kill matrix (suite x mutant)."""
+    mutants = mutants or list(MUTANTS)
+    unknown = [m for m in mutants if m not in MUTANTS]
+    if unknown:
+        raise ValueError(f"Unknown mutants: {', '.join(unknown)}")
+    suites = {}
+    for file_path in suite_files:
+        if not os.path.exists(file_path):
+            print(f"Skipping missing suite: {file_path}")
+            continue
+        arrays, excluded = baseline_filter(load_suite_arrays(file_path))
+        suites[file_path] = arrays
+        print(f"Loaded {file_path}: {len(arrays['day'])} usable test cases"
+              + (f" ({excluded} excluded: expectation disagrees with the original)" if excluded else ""))
+
+    killers: Dict[Tuple[str, str], Optional[int]] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(suites,)) as executor:
+        futures = [executor.submit(_run_mutant, suite, mutant) for suite in suites for mutant in mutants]
+        for future in futures:
+            suite, mutant, index = future.result()
+            killers[(suite, mutant)] = index
+
+    matrix = pd.DataFrame(
+        [[killers[(suite, mutant)] is not None for mutant in mutants] for suite in suites],
+        index=list(suites), columns=mutants)
+    return matrix
+
+
+def print_kill_matrix(matrix: pd.DataFrame):
+    scored = [m for m in matrix.columns if m != 'original']
+    print("\n=== KILL MATRIX (X = killed) ===")
+    for mutant in matrix.columns:
+        marks = "  ".join(("X" if matrix.loc[suite, mutant] else ".").center(8) for suite in matrix.index)
+        print(f"{mutant:<28} {marks}")
+    print(f"{'':<28} " + "  ".join(f"S{i + 1}".center(8) for i in range(len(matrix.index))))
+    for i, suite in enumerate(matrix.index):
+        print(f"  S{i + 1} = {suite}")
+
+    print("\n=== KILL RATE PER SUITE ===")
+    for suite in matrix.index:
+        killed = int(matrix.loc[suite, scored].sum())
+        print(f"{suite}: {killed}/{len(scored)} mutants killed ({killed / len(scored) * 100:.1f}%)")
+
+    if 'original' in matrix.columns and matrix['original'].any():
+        print("\nWarning: the unmutated implementation was 'killed'; check the baseline filter.")
+    survivors = [m for m in scored if not matrix[m].any()]
+    if survivors:
+        print(f"\nMutants no suite kills: {', '.join(survivors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score Next Date test suites by the mutants they kill")
+    parser.add_argument('suites', nargs='*', default=DEFAULT_SUITES, help='Suite files (CSV/XLSX/.nds)')
+    parser.add_argument('--mutants', type=str, help=f"Comma-separated subset of mutants ({', '.join(MUTANTS)})")
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--output', type=str, default='mutation_kill_matrix.csv', help='Where to save the kill matrix')
+    args = parser.parse_args()
+
+    mutants = [m.strip() for m in args.mutants.split(',')] if args.mutants else None
+    print("=== MUTATION TESTING ===\n")
+    matrix = run_mutation_analysis(args.suites, mutants, args.workers)
+    print_kill_matrix(matrix)
+    matrix.to_csv(args.output)
+    print(f"\nKill matrix saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import argparse
 import csv
 import os
-import requests
 from typing import List, Tuple, Dict
 import openpyxl
 from dotenv import load_dotenv
+from chunked_generation import generate_unique_cases, plan_chunk_size, print_generation_report
+from providers import (GeminiProvider, MockProvider, OpenAICompatibleProvider, TestCaseProvider,
+                       compare_providers, fan_out, make_session, summarize_comparison)
+
+PROVIDER_NAMES = ['gemini', 'openai', 'mock']
 
 
 # --- Gemini API Test Case Generation ---
@@ -13,34 +17,36 @@ def generate_next_date_cases_gemini(api_key: str, num_cases: int = 10) -> List[T
     Generate test cases for the next date problem using Gemini 2.0 API.
     Returns list of (input_date, expected_next_date).
     """
-    # Gemini 2.0 Flash model name: gemini-2.0-flash
-    url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-    headers = {"Content-Type": "application/json"}
-    prompt = (
-        f"Generate {num_cases} test cases for the next date problem using robust boundary value analysis and normal test cases. "
-        "Include both positive (valid) and negative (invalid) cases, focusing on boundary values such as month ends, leap years, minimum and maximum years, and invalid dates. "
-        "Each test case should be in the format: YYYY-MM-DD,YYYY-MM-DD (input_date,expected_next_date) for valid cases, and YYYY-MM-DD,INVALID for invalid cases. "
-        "Separate each test case by a newline. Only output the test cases."
-    )
-    data = {
-        "contents": [{"parts": [{"text": prompt}]}]
-    }
-    params = {"key": api_key}
-    response = requests.post(url, headers=headers, params=params, json=data)
-    cases = []
-    if response.status_code == 200:
-        try:
-            result = response.json()
-            text = result["candidates"][0]["content"]["parts"][0]["text"]
-            for line in text.strip().split("\n"):
-                parts = line.split(",")
-                if len(parts) == 2:
-                    cases.append((parts[0].strip(), parts[1].strip()))
-        except Exception as e:
-            print(f"Error parsing Gemini response: {e}")
-    else:
-        print(f"Gemini API error: {response.status_code} {response.text}")
-    return cases
+    return GeminiProvider(api_key).generate(num_cases)
+
+# --- Multi-Provider Generation ---
+def build_providers(names: List[str], args) -> List[TestCaseProvider]:
+    """Create the selected providers over one shared connection pool."""
+    session = make_session(pool_size=max(10, len(names) * args.batches))
+    rate_limits = {}
+    for item in args.rate_limit or []:
+        name, _, rpm = item.partition('=')
+        rate_limits[name.strip()] = float(rpm)
+
+    providers = []
+    for name in names:
+        common = {"session": session, "requests_per_minute": rate_limits.get(name)}
+        if name == 'gemini':
+            api_key = args.api_key or os.environ.get('GEMINI_API_KEY')
+            if not api_key:
+                raise ValueError("Gemini API key required. Use --api-key or set GEMINI_API_KEY in .env file.")
+            providers.append(GeminiProvider(api_key, **common))
+        elif name == 'openai':
+            providers.append(OpenAICompatibleProvider(
+                args.openai_api_key or os.environ.get('OPENAI_API_KEY'),
+                model=args.openai_model,
+                base_url=args.openai_base_url or os.environ.get('OPENAI_BASE_URL', 'https://api.openai.com/v1'),
+                **common))
+        elif name == 'mock':
+            providers.append(MockProvider(**common))
+        else:
+            raise ValueError(f"Unknown provider: {name} (choose from {', '.join(PROVIDER_NAMES)})")
+    return providers
 
 # --- File Comparison ---
 def read_test_file(file_path: str) -> List[Tuple[str, str]]:
@@ -87,19 +93,65 @@ def main():
     parser.add_argument('--upload', type=str, help='Path to uploaded test case file (CSV/XLSX)')
     parser.add_argument('--gemini', action='store_true', help='Use Gemini API to generate test cases')
     parser.add_argument('--api-key', type=str, help='Gemini API key (or set GEMINI_API_KEY in .env)')
+    parser.add_argument('--chunk-size', type=int, default=200, help='With --gemini, larger --generate counts are split into chunks of at most this many cases')
+    parser.add_argument('--providers', type=str, help=f"Comma-separated providers to query concurrently ({', '.join(PROVIDER_NAMES)})")
+    parser.add_argument('--batches', type=int, default=1, help='Concurrent requests per provider with --providers')
+    parser.add_argument('--rate-limit', action='append', metavar='PROVIDER=RPM', help='Requests per minute for one provider (repeatable)')
+    parser.add_argument('--openai-api-key', type=str, help='OpenAI-compatible API key (or set OPENAI_API_KEY in .env)')
+    parser.add_argument('--openai-base-url', type=str, help='OpenAI-compatible base URL (or set OPENAI_BASE_URL in .env)')
+    parser.add_argument('--openai-model', type=str, default='gpt-4o-mini', help='Model name for the OpenAI-compatible backend')
     args = parser.parse_args()
 
+    if args.providers:
+        names = [name.strip() for name in args.providers.split(',') if name.strip()]
+        try:
+            providers = build_providers(names, args)
+        except ValueError as e:
+            print(e)
+            return
+        results = fan_out(providers, args.generate, args.batches)
+        for name, cases in results.items():
+            save_test_cases_to_csv(cases, f'{name}_generated_testcases.csv')
+            print(f"{name}: {len(cases)} test cases saved to {name}_generated_testcases.csv")
+        rows = compare_providers(results)
+        print()
+        summarize_comparison(results, rows)
+        if rows:
+            with open('multi_provider_comparison.csv', 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+            print("\nMulti-provider comparison saved to: multi_provider_comparison.csv")
+
+        if args.upload:
+            if not os.path.exists(args.upload):
+                print(f"File not found: {args.upload}")
+                return
+            uploaded = read_test_file(args.upload)
+            print("\nComparison Results:")
+            for name, cases in results.items():
+                result = compare_cases(cases, uploaded)
+                print(f"{name}: Positive cases: {result['positive']} | Negative cases: {result['negative']} | Total cases checked: {result['total']}")
+        return
+
     if args.gemini:
         api_key = args.api_key or os.environ.get('GEMINI_API_KEY')
         if not api_key:
             print("Gemini API key required. Use --api-key or set GEMINI_API_KEY in .env file.")
             return
-        generated = generate_next_date_cases_gemini(api_key, args.generate)
+        if args.generate > args.chunk_size:
+            # Too many for one prompt: deduplicated, oracle-checked chunks instead
+            result = generate_unique_cases(GeminiProvider(api_key), args.generate,
+                                           plan_chunk_size(args.chunk_size, 8192))
+            print_generation_report(result, args.generate)
+            generated = result["cases"]
+        else:
+            generated = generate_next_date_cases_gemini(api_key, args.generate)
         # Save generated test cases to CSV
         save_test_cases_to_csv(generated, 'gemini_generated_testcases.csv')
         print(f"Gemini-generated test cases saved to gemini_generated_testcases.csv")
     else:
-        print("Please use --gemini to generate test cases via Gemini API.")
+        print("Please use --gemini to generate test cases via Gemini API, or --providers to query several backends.")
         return
 
     print(f"Generated {len(generated)} test cases.")
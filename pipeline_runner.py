@@ -0,0 +1,212 @@
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+import pandas as pd
+from dotenv import load_dotenv
+from actual_test_cases import fill_actual_results
+from analyze_leap_years import analyze_leap_year_conditions
+from analyze_month_year_boundaries import analyze_month_year_boundaries
+from chunked_generation import generate_unique_cases
+from compare_bva_gemini import BVA_COLUMNS, compare_bva_with_gemini, parse_bva_file
+from compare_results import compare_results
+from excel_schema import load_workbook_columns
+from providers import GeminiProvider, MockProvider
+from view_results import view_results
+
+# Input files the pipeline starts from, and how each is parsed
+SOURCES = {
+    'cases': 'next_date_test_cases.xlsx',
+    'bva': 'NextDate_BVA_TestCases.xlsx',
+    'gemini': 'gemini_generated_testcases.csv',
+}
+LOADERS: Dict[str, Callable] = {
+    'cases': load_workbook_columns,
+    'bva': lambda path: load_workbook_columns(path, BVA_COLUMNS),
+    'gemini': lambda path: pd.read_csv(path, header=None, names=['input_date', 'expected_output']),
+}
+
+# Files each stage writes when persisting intermediates
+OUTPUTS = {
+    'fill': 'next_date_final_with_results.xlsx',
+    'compare': 'detailed_comparison_results.csv',
+    'compare_bva': 'bva_gemini_comparison.csv',
+}
+
+
+def _output(name: str, persist: bool) -> Optional[str]:
+    return OUTPUTS[name] if persist else None
+
+
+# Downstream stages in dependency order: name -> (inputs, function(data, persist)).
+# Inputs are source names or earlier stage names; tables are passed in memory.
+STAGES: Dict[str, Tuple[List[str], Callable]] = {
+    'fill': (['cases'], lambda data, persist: fill_actual_results(
+        SOURCES['cases'], _output('fill', persist), df=data['cases'])),
+    'view': (['fill'], lambda data, persist: view_results(data['fill'])),
+    'compare': (['fill', 'gemini'], lambda data, persist: compare_results(
+        data['fill'], data['gemini'], _output('compare', persist))),
+    'compare_bva': (['bva', 'gemini'], lambda data, persist: compare_bva_with_gemini(
+        parse_bva_file(df=data['bva']), data['gemini'], _output('compare_bva', persist))),
+    'leap_years': (['bva', 'cases', 'gemini'], lambda data, persist: analyze_leap_year_conditions(
+        data['bva'], data['cases'], data['gemini'])),
+    'boundaries': (['bva', 'cases', 'gemini'], lambda data, persist: analyze_month_year_boundaries(
+        data['bva'], data['cases'], data['gemini'])),
+}
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends each stage thread's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_stages(names: List[str], data: Dict[str, object], stages: Dict[str, Tuple[List[str], Callable]] = STAGES,
+               persist: bool = False, max_workers: int = 4) -> Dict[str, float]:
+    """
+    Run the named stages as a DAG: every stage whose inputs are ready runs concurrently
+    with the others. Outputs are stored in data under the stage name. Each stage's
+    console output is buffered and printed as a block when it finishes, so concurrent
+    stages don't interleave. A failed stage is reported and its dependents are skipped.
+    Returns the wall time of each stage in milliseconds.
+    """
+    pending = list(names)
+    timings: Dict[str, float] = {}
+    failed = set()
+    output = _ThreadOutput(sys.stdout)
+
+    def run_one(name):
+        inputs, stage = stages[name]
+        output.local.buffer = io.StringIO()
+        started = time.perf_counter()
+        try:
+            data[name] = stage(data, persist)
+            error = None
+        except Exception as e:
+            error = e
+        elapsed = (time.perf_counter() - started) * 1000
+        text = output.local.buffer.getvalue()
+        output.local.buffer = None
+        return name, text, error, elapsed
+
+    real_stdout, sys.stdout = sys.stdout, output
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while pending or running:
+                for name in list(pending):
+                    inputs = stages[name][0]
+                    if any(i in failed for i in inputs):
+                        pending.remove(name)
+                        failed.add(name)
+                        real_stdout.write(f"\n##### {name} skipped: an input stage failed #####\n")
+                    elif all(i in data and i not in pending and i not in running.values() for i in inputs):
+                        pending.remove(name)
+                        running[executor.submit(run_one, name)] = name
+                if not running:
+                    for name in pending:
+                        real_stdout.write(f"\n##### {name} skipped: missing input #####\n")
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    name, text, error, elapsed = future.result()
+                    timings[name] = elapsed
+                    real_stdout.write(f"\n##### {name} #####\n{text}")
+                    if error is not None:
+                        failed.add(name)
+                        data.pop(name, None)
+                        real_stdout.write(f"Stage {name} failed: {error}\n")
+                    real_stdout.write(f"##### {name} done in {elapsed:.0f} ms #####\n")
+    finally:
+        sys.stdout = real_stdout
+    return timings
+
+
+def generate_stage(provider_name: str, num_cases: int, api_key: Optional[str]):
+    """
+    Stage that replaces the Gemini CSV source with freshly generated, oracle-checked cases.
+    Persisted cases go to <provider>_generated_testcases.csv, so mock runs leave the Gemini CSV alone.
+    """
+    def stage(data, persist):
+        if provider_name == 'gemini':
+            provider = GeminiProvider(api_key)
+        else:
+            provider = MockProvider()
+        result = generate_unique_cases(provider, num_cases)
+        print(f"Generated {len(result['cases'])} test cases with {result['stats']['requests']} API calls "
+              f"({result['stop_reason']})")
+        df = pd.DataFrame(result["cases"], columns=['input_date', 'expected_output'])
+        if persist:
+            path = f"{provider_name}_generated_testcases.csv"
+            df.to_csv(path, header=False, index=False)
+            print(f"Generated test cases saved to: {path}")
+        return df
+    return stage
+
+
+def run_pipeline(steps: Optional[List[str]] = None, generate: Optional[int] = None, provider: str = 'mock',
+                 api_key: Optional[str] = None, persist: bool = False, max_workers: int = 4) -> Dict[str, object]:
+    """Load (or generate) the inputs, then run the downstream stages in memory. Returns every table produced."""
+    stages: Dict[str, Tuple[List[str], Callable]] = {}
+    for name, path in SOURCES.items():
+        if name == 'gemini' and generate:
+            stages[name] = ([], generate_stage(provider, generate, api_key))
+        else:
+            stages[name] = ([], lambda data, persist, path=path, name=name: LOADERS[name](path))
+    stages.update(STAGES)
+
+    selected = steps or list(STAGES)
+    # Only the sources the selected stages actually need
+    needed = set(selected)
+    for name in reversed(list(stages)):
+        if name in needed:
+            needed.update(stages[name][0])
+    names = [name for name in stages if name in needed]
+
+    data: Dict[str, object] = {}
+    started = time.perf_counter()
+    timings = run_stages(names, data, stages, persist, max_workers)
+    total = (time.perf_counter() - started) * 1000
+    print(f"\n=== PIPELINE FINISHED IN {total:.0f} ms (sum of stage times {sum(timings.values()):.0f} ms) ===")
+    return data
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Run generate -> fill -> compare -> analyze in memory")
+    parser.add_argument('--steps', type=str, help=f"Comma-separated subset of stages ({', '.join(STAGES)})")
+    parser.add_argument('--generate', type=int, help='Generate this many cases instead of reading the Gemini CSV')
+    parser.add_argument('--provider', choices=['gemini', 'mock'], default='mock', help='Backend for --generate')
+    parser.add_argument('--api-key', type=str, help='Gemini API key (or set GEMINI_API_KEY in .env)')
+    parser.add_argument('--persist', action='store_true', help='Also write the intermediate files to disk')
+    parser.add_argument('--workers', type=int, default=4, help='Stages run concurrently')
+    args = parser.parse_args()
+
+    api_key = args.api_key or os.environ.get('GEMINI_API_KEY')
+    if args.generate and args.provider == 'gemini' and not api_key:
+        print("Gemini API key required. Use --api-key or set GEMINI_API_KEY in .env file.")
+        return
+    steps = [step.strip() for step in args.steps.split(',')] if args.steps else None
+    unknown = [step for step in steps or [] if step not in STAGES]
+    if unknown:
+        print(f"Unknown stages: {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+        return
+    run_pipeline(steps, args.generate, args.provider, api_key, args.persist, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from suite_cases import normalize_expected, oracle_expected, parse_input_date
+
+
+def build_prompt(num_cases: int, focus: Optional[str] = None) -> str:
+    """Prompt shared by every LLM backend so their outputs are comparable."""
+    prompt = (
+        f"Generate {num_cases} test cases for the next date problem using robust boundary value analysis and normal test cases. "
+        "Include both positive (valid) and negative (invalid) cases, focusing on boundary values such as month ends, leap years, minimum and maximum years, and invalid dates. "
+        "Each test case should be in the format: YYYY-MM-DD,YYYY-MM-DD (input_date,expected_next_date) for valid cases, and YYYY-MM-DD,INVALID for invalid cases. "
+        "Separate each test case by a newline. Only output the test cases."
+    )
+    if focus:
+        prompt += f" Concentrate this batch on: {focus}."
+    return prompt
+
+
+def parse_response(text: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Split a model response into parsed (input_date, expected) cases and rejected non-empty lines."""
+    cases, rejected = [], []
+    for line in text.strip().split("\n"):
+        parts = line.split(",")
+        if len(parts) == 2:
+            cases.append((parts[0].strip(), parts[1].strip()))
+        elif line.strip():
+            rejected.append(line.strip())
+    return cases, rejected
+
+
+def parse_cases(text: str) -> List[Tuple[str, str]]:
+    """Parse 'input_date,expected' lines out of a model response."""
+    return parse_response(text)[0]
+
+
+def oracle_output(input_date: str) -> str:
+    """The local oracle's (get_next_date) answer for a YYYY-MM-DD input; INVALID if it doesn't parse."""
+    parsed = parse_input_date(input_date)
+    return oracle_expected(*parsed) if parsed else "INVALID"
+
+
+def make_session(pool_size: int = 10) -> requests.Session:
+    """HTTP session whose connection pool is shared by all providers in a fan-out."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least 60/requests_per_minute seconds apart."""
+
+    def __init__(self, requests_per_minute: Optional[float] = None):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class TestCaseProvider(ABC):
+    """
+    Backend that turns a prompt into (input_date, expected_next_date) pairs.
+    Subclasses implement _request_text; generate adds rate limiting, parsing and error reporting.
+    """
+    name = "provider"
+
+    def __init__(self, session: Optional[requests.Session] = None, requests_per_minute: Optional[float] = None):
+        self.session = session or requests.Session()
+        self.rate_limiter = RateLimiter(requests_per_minute)
+
+    def generate_with_rejects(self, num_cases: int, focus: Optional[str] = None) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """Like generate, but also returns the response lines that could not be parsed."""
+        self.rate_limiter.wait()
+        try:
+            text = self._request_text(build_prompt(num_cases, focus), num_cases)
+        except requests.RequestException as e:
+            print(f"{self.name} request failed: {e}")
+            return [], []
+        if text is None:
+            return [], []
+        return parse_response(text)
+
+    def generate(self, num_cases: int, focus: Optional[str] = None) -> List[Tuple[str, str]]:
+        return self.generate_with_rejects(num_cases, focus)[0]
+
+    @abstractmethod
+    def _request_text(self, prompt: str, num_cases: int) -> Optional[str]:
+        """Return the raw model text for prompt, or None after reporting an error."""
+
+
+class GeminiProvider(TestCaseProvider):
+    name = "gemini"
+
+    def __init__(self, api_key: str, model: str = "gemini-2.0-flash",
+                 base_url: str = "https://generativelanguage.googleapis.com/v1beta", **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+
+    def _request_text(self, prompt: str, num_cases: int) -> Optional[str]:
+        url = f"{self.base_url}/models/{self.model}:generateContent"
+        data = {"contents": [{"parts": [{"text": prompt}]}]}
+        response = self.session.post(url, headers={"Content-Type": "application/json"},
+                                     params={"key": self.api_key}, json=data)
+        if response.status_code != 200:
+            print(f"Gemini API error: {response.status_code} {response.text}")
+            return None
+        try:
+            result = response.json()
+            return result["candidates"][0]["content"]["parts"][0]["text"]
+        except Exception as e:
+            print(f"Error parsing Gemini response: {e}")
+            return None
+
+
+class OpenAICompatibleProvider(TestCaseProvider):
+    """Any server exposing the OpenAI /chat/completions API (OpenAI, vLLM, Ollama, LM Studio, ...)."""
+    name = "openai"
+
+    def __init__(self, api_key: Optional[str], model: str = "gpt-4o-mini",
+                 base_url: str = "https://api.openai.com/v1", **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+
+    def _request_text(self, prompt: str, num_cases: int) -> Optional[str]:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        data = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0,
+        }
+        response = self.session.post(f"{self.base_url}/chat/completions", headers=headers, json=data)
+        if response.status_code != 200:
+            print(f"OpenAI API error: {response.status_code} {response.text}")
+            return None
+        try:
+            result = response.json()
+            return result["choices"][0]["message"]["content"]
+        except Exception as e:
+            print(f"Error parsing OpenAI response: {e}")
+            return None
+
+
+class MockProvider(TestCaseProvider):
+    """Offline backend: boundary dates plus random ones, with answers from the local oracle."""
+    name = "mock"
+
+    BOUNDARY_INPUTS = [
+        "2023-01-31", "2023-04-30", "2023-12-31", "2024-02-28", "2024-02-29", "2023-02-28",
+        "2023-02-29", "1900-02-28", "1900-02-29", "2000-02-29", "2023-04-31", "2023-13-01",
+        "2023-00-01", "2023-01-00", "2023-01-32", "0001-01-01", "9999-12-30",
+    ]
+
+    def __init__(self, seed: int = 0, error_rate: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.random = random.Random(seed)
+        # Fraction of valid cases answered one day off, to exercise downstream validation
+        self.error_rate = error_rate
+
+    def _request_text(self, prompt: str, num_cases: int) -> Optional[str]:
+        # Like a real model: some boundary favourites (repeated across calls), then fresh dates
+        inputs = self.random.sample(self.BOUNDARY_INPUTS, min(len(self.BOUNDARY_INPUTS), (num_cases + 1) // 2))
+        while len(inputs) < num_cases:
+            d = date.fromordinal(self.random.randint(date(1900, 1, 1).toordinal(), date(2100, 12, 31).toordinal()))
+            inputs.append(d.strftime("%Y-%m-%d"))
+        lines = []
+        for inp in inputs:
+            expected = oracle_output(inp)
+            if expected != "INVALID" and self.random.random() < self.error_rate:
+                expected = oracle_output(expected)
+            lines.append(f"{inp},{expected}")
+        return "\n".join(lines)
+
+
+def fan_out(providers: List[TestCaseProvider], num_cases: int, batches: int = 1) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Send `batches` generation requests of num_cases each to every provider concurrently.
+    Each provider's own rate limiter paces its requests; results are merged per provider.
+    """
+    results: Dict[str, List[Tuple[str, str]]] = {provider.name: [] for provider in providers}
+    jobs = [provider for provider in providers for _ in range(batches)]
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as executor:
+        futures = [(provider.name, executor.submit(provider.generate, num_cases)) for provider in jobs]
+        for name, future in futures:
+            results[name].extend(future.result())
+    return results
+
+
+def compare_providers(results: Dict[str, List[Tuple[str, str]]]) -> List[Dict[str, str]]:
+    """
+    Multi-way comparison: one row per input date with every provider's expected output
+    and the local oracle's answer. For inputs at least two providers produced, status
+    is AGREE when they all gave the same answer and DISAGREE otherwise; inputs from a
+    single provider are <NAME>_ONLY.
+    """
+    outputs: Dict[str, Dict[str, str]] = {}
+    for name, cases in results.items():
+        for inp, out in cases:
+            outputs.setdefault(inp, {}).setdefault(name, normalize_expected(out))
+
+    rows = []
+    for inp in sorted(outputs):
+        row = {'input': inp}
+        for name in results:
+            row[f'{name}_output'] = outputs[inp].get(name, '')
+        row['oracle_output'] = oracle_output(inp)
+        if len(outputs[inp]) == 1:
+            row['status'] = f"{next(iter(outputs[inp])).upper()}_ONLY"
+        else:
+            row['status'] = 'AGREE' if len(set(outputs[inp].values())) == 1 else 'DISAGREE'
+        rows.append(row)
+    return rows
+
+
+def summarize_comparison(results: Dict[str, List[Tuple[str, str]]], rows: List[Dict[str, str]]):
+    names = list(results)
+    print("=== MULTI-PROVIDER COMPARISON SUMMARY ===")
+    for name in names:
+        print(f"{name}: {len(results[name])} test cases")
+    print(f"Distinct inputs: {len(rows)}")
+    print(f"Inputs from a single provider: {sum(1 for row in rows if row['status'].endswith('_ONLY'))}")
+    print(f"Agreement across providers: {sum(1 for row in rows if row['status'] == 'AGREE')}")
+    print(f"Disagreement across providers: {sum(1 for row in rows if row['status'] == 'DISAGREE')}")
+
+    print("\n=== ACCURACY AGAINST LOCAL ORACLE ===")
+    for name in names:
+        answered = [row for row in rows if row[f'{name}_output']]
+        correct = sum(1 for row in answered if row[f'{name}_output'] == row['oracle_output'])
+        if answered:
+            print(f"{name}: {correct}/{len(answered)} ({correct / len(answered) * 100:.1f}%)")
+
+    if len(names) > 1:
+        print("\n=== PAIRWISE AGREEMENT ON SHARED INPUTS ===")
+        for i, a in enumerate(names):
+            for b in names[i + 1:]:
+                shared = [row for row in rows if row[f'{a}_output'] and row[f'{b}_output']]
+                same = sum(1 for row in shared if row[f'{a}_output'] == row[f'{b}_output'])
+                print(f"{a} vs {b}: {same}/{len(shared)} shared inputs agree")
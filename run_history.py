@@ -0,0 +1,226 @@
+import argparse
+import csv
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+from actual_test_cases import fill_actual_results
+from compare_bva_gemini import compare_bva_with_gemini
+from compare_results import compare_results
+from excel_schema import role_headers
+from suite_cases import format_input_date
+
+DEFAULT_DB = 'run_history.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id     INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind       TEXT NOT NULL,
+    source     TEXT,
+    created_at TEXT NOT NULL,
+    row_count  INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id     INTEGER NOT NULL REFERENCES runs(run_id),
+    case_id    TEXT,
+    input_date TEXT NOT NULL,
+    expected   TEXT,
+    actual     TEXT,
+    status     TEXT NOT NULL
+);
+-- (run_id, status, input_date) lets flipped_cases probe each side of the join directly
+CREATE INDEX IF NOT EXISTS idx_results_run_status_input ON results(run_id, status, input_date);
+CREATE INDEX IF NOT EXISTS idx_results_input ON results(input_date, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results(status);
+"""
+
+# Run kinds and which columns of each comparison row hold (expected, actual)
+FILL = 'fill'
+FINAL_VS_GEMINI = 'final_vs_gemini'
+BVA_VS_GEMINI = 'bva_vs_gemini'
+COMPARISON_COLUMNS = {
+    FINAL_VS_GEMINI: ('gemini_output', 'final_output'),
+    BVA_VS_GEMINI: ('bva_output', 'gemini_output'),
+}
+
+ResultRow = Tuple[Optional[str], str, Optional[str], Optional[str], str]
+
+
+def connect(db_path: str = DEFAULT_DB) -> sqlite3.Connection:
+    """Open (and create if needed) the run-history database."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_run(conn: sqlite3.Connection, kind: str, rows: Iterable[ResultRow], source: Optional[str] = None) -> int:
+    """
+    Bulk-insert (case_id, input_date, expected, actual, status) rows as a new run
+    in a single transaction. Returns the new run ID.
+    """
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO runs (kind, source, created_at) VALUES (?, ?, ?)",
+            (kind, source, datetime.now().isoformat(timespec='seconds')))
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO results (run_id, case_id, input_date, expected, actual, status) VALUES (?, ?, ?, ?, ?, ?)",
+            ((run_id, *row) for row in rows))
+        conn.execute(
+            "UPDATE runs SET row_count = (SELECT COUNT(*) FROM results WHERE run_id = ?) WHERE run_id = ?",
+            (run_id, run_id))
+    return run_id
+
+
+def _text(value) -> Optional[str]:
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return None
+    return str(value).strip()
+
+
+def fill_rows(df: pd.DataFrame) -> Iterable[ResultRow]:
+    """Turn the DataFrame returned by fill_actual_results into result rows."""
+    headers = role_headers(df.columns)
+    id_col = headers.get('Test Case ID')
+    expected_col = headers.get('Expected Output')
+    for _, row in df.iterrows():
+        yield (
+            _text(row[id_col]) if id_col else None,
+            format_input_date(int(row[headers['Day']]), int(row[headers['Month']]), int(row[headers['Year']])),
+            _text(row[expected_col]) if expected_col else None,
+            _text(row['Actual Output']),
+            _text(row['Result (Pass/Fail)']),
+        )
+
+
+def comparison_rows(kind: str, comparisons: List[Dict]) -> Iterable[ResultRow]:
+    """Turn the rows returned by compare_results / compare_bva_with_gemini into result rows."""
+    expected_key, actual_key = COMPARISON_COLUMNS[kind]
+    for case in comparisons:
+        yield (None, case['input'], _text(case.get(expected_key)), _text(case.get(actual_key)), case['status'])
+
+
+def record_fill_results(conn: sqlite3.Connection, df: pd.DataFrame, source: Optional[str] = None) -> int:
+    return record_run(conn, FILL, fill_rows(df), source)
+
+
+def record_comparison(conn: sqlite3.Connection, kind: str, comparisons: List[Dict], source: Optional[str] = None) -> int:
+    return record_run(conn, kind, comparison_rows(kind, comparisons), source)
+
+
+def import_comparison_csv(conn: sqlite3.Connection, file_path: str, kind: str) -> int:
+    """Import a saved comparison CSV (e.g. a hand-renamed detailed_comparison_results copy) as a run."""
+    with open(file_path, 'r', newline='') as f:
+        comparisons = [{key: (value if value != '' else None) for key, value in row.items()}
+                       for row in csv.DictReader(f)]
+    return record_comparison(conn, kind, comparisons, source=file_path)
+
+
+def list_runs(conn: sqlite3.Connection) -> List[Tuple]:
+    return conn.execute(
+        "SELECT run_id, kind, source, created_at, row_count FROM runs ORDER BY run_id").fetchall()
+
+
+def status_counts(conn: sqlite3.Connection, run_id: int) -> Dict[str, int]:
+    return dict(conn.execute(
+        "SELECT status, COUNT(*) FROM results WHERE run_id = ? GROUP BY status", (run_id,)).fetchall())
+
+
+def flipped_cases(conn: sqlite3.Connection, old_run: int, new_run: int,
+                  from_status: str = 'MATCH', to_status: str = 'MISMATCH') -> List[Tuple]:
+    """
+    (case_id, input_date, old expected, old actual, new expected, new actual) for cases
+    whose status was from_status in old_run and to_status in new_run. Suites repeat
+    input dates, so rows are paired by case ID when both runs have one.
+    """
+    return conn.execute(
+        """
+        SELECT DISTINCT a.case_id, a.input_date, a.expected, a.actual, b.expected, b.actual
+        FROM results a
+        JOIN results b ON b.run_id = ? AND b.input_date = a.input_date AND b.status = ?
+            AND (a.case_id IS NULL OR b.case_id IS NULL OR a.case_id = b.case_id)
+        WHERE a.run_id = ? AND a.status = ?
+        ORDER BY a.input_date, a.case_id
+        """,
+        (new_run, to_status, old_run, from_status)).fetchall()
+
+
+def case_history(conn: sqlite3.Connection, input_date: str) -> List[Tuple]:
+    """Every recorded result for one input date, oldest run first."""
+    return conn.execute(
+        """
+        SELECT r.run_id, runs.kind, runs.created_at, r.expected, r.actual, r.status
+        FROM results r JOIN runs ON runs.run_id = r.run_id
+        WHERE r.input_date = ?
+        ORDER BY r.run_id
+        """,
+        (input_date,)).fetchall()
+
+
+def record_current_runs(db_path: str = DEFAULT_DB):
+    """Run fill/compare/compare-BVA as usual and record each result set under a new run ID."""
+    conn = connect(db_path)
+    df = fill_actual_results("next_date_test_cases.xlsx", "next_date_final_with_results.xlsx")
+    print(f"Recorded fill results as run {record_fill_results(conn, df, 'next_date_test_cases.xlsx')}\n")
+
+    comparisons = compare_results()
+    if comparisons:
+        run_id = record_comparison(conn, FINAL_VS_GEMINI, comparisons, 'detailed_comparison_results.csv')
+        print(f"\nRecorded final vs Gemini comparison as run {run_id}\n")
+
+    comparisons = compare_bva_with_gemini()
+    if comparisons:
+        run_id = record_comparison(conn, BVA_VS_GEMINI, comparisons, 'bva_gemini_comparison.csv')
+        print(f"\nRecorded BVA vs Gemini comparison as run {run_id}")
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run history for Next Date results and comparisons")
+    parser.add_argument('--db', type=str, default=DEFAULT_DB, help='SQLite database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('record', help='Run fill and both comparisons, recording each as a run')
+    imp = sub.add_parser('import', help='Import a saved comparison CSV as a run')
+    imp.add_argument('file')
+    imp.add_argument('--kind', choices=list(COMPARISON_COLUMNS), default=FINAL_VS_GEMINI)
+    sub.add_parser('runs', help='List recorded runs')
+    flips = sub.add_parser('flips', help='Cases that changed status between two runs')
+    flips.add_argument('old_run', type=int)
+    flips.add_argument('new_run', type=int)
+    flips.add_argument('--from-status', default='MATCH')
+    flips.add_argument('--to-status', default='MISMATCH')
+    hist = sub.add_parser('history', help='All recorded results for one input date (YYYY-MM-DD)')
+    hist.add_argument('input_date')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_current_runs(args.db)
+        return
+
+    conn = connect(args.db)
+    if args.command == 'import':
+        run_id = import_comparison_csv(conn, args.file, args.kind)
+        print(f"Imported {args.file} as run {run_id}")
+    elif args.command == 'runs':
+        print("=== RECORDED RUNS ===")
+        for run_id, kind, source, created_at, row_count in list_runs(conn):
+            print(f"Run {run_id}: {kind} | {created_at} | {row_count} rows | {source}")
+            for status, count in sorted(status_counts(conn, run_id).items()):
+                print(f"    {status}: {count}")
+    elif args.command == 'flips':
+        flipped = flipped_cases(conn, args.old_run, args.new_run, args.from_status, args.to_status)
+        print(f"=== {args.from_status} -> {args.to_status} BETWEEN RUN {args.old_run} AND RUN {args.new_run} ===")
+        print(f"Flipped cases: {len(flipped)}")
+        for i, (case_id, input_date, old_exp, old_act, new_exp, new_act) in enumerate(flipped):
+            label = f"{case_id} " if case_id else ""
+            print(f"{i+1}. {label}Input: {input_date} | Before: {old_exp} / {old_act} | After: {new_exp} / {new_act}")
+    elif args.command == 'history':
+        for run_id, kind, created_at, expected, actual, status in case_history(conn, args.input_date):
+            print(f"Run {run_id} ({kind}, {created_at}): Expected: {expected} | Actual: {actual} | Status: {status}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
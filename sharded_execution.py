@@ -0,0 +1,634 @@
+import argparse
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import date
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from actual_test_cases import get_next_date
+from binary_suite_format import STATUS_CODES, convert_to_binary, open_suite, write_suite_arrays
+from mutation_testing import MUTANTS, decode_suite_arrays, mutant_next_date
+from next_date_tool import compare_cases
+from suite_cases import format_input_date, oracle_expected
+
+# Work is leased out as ordinal ranges [start, stop) of a binary suite. Workers read
+# their range from the suite file, write Pass/Fail or MATCH/MISMATCH into its status
+# column in place and send back the counts, so every worker needs the file at the same
+# path (localhost, or a shared mount when the workers run on other machines).
+# Protocol: one JSON object per line over TCP, each request answered by one reply.
+#   {"op": "lease"}                                 -> {"shard": {...}, "job": {...}} | {"wait": s} | {"done": true}
+#   {"op": "renew", "shard": id, "lease": lease}    -> {"ok": bool, "closed": bool, "discard": bool}
+#   {"op": "complete", "shard": id, "lease": lease, "result": {...}} -> {"ok": bool}
+#   {"op": "fail", "shard": id, "lease": lease, "error": text}      -> {"ok": true}
+MODES = ['fill', 'compare']
+DEFAULT_PORT = 5077
+WORK_CHUNK = 10000  # cases evaluated between lease renewals
+MAX_EXAMPLES = 5    # failing cases reported back per shard
+
+
+# --- Implementations for the differential compare ---
+def _format_packed(packed: np.ndarray) -> List[str]:
+    return ["INVALID" if v == 0 else f"{v // 10000:04d}-{v // 100 % 100:02d}-{v % 100:02d}" for v in packed.tolist()]
+
+
+def _oracle_outputs(arrays: Dict[str, np.ndarray]) -> List[str]:
+    return [oracle_expected(d, m, y) for d, m, y in
+            zip(arrays['day'].tolist(), arrays['month'].tolist(), arrays['year'].tolist())]
+
+
+def _mutant_outputs(name: str) -> Callable[[Dict[str, np.ndarray]], List[str]]:
+    faults = frozenset(MUTANTS[name])
+    return lambda arrays: _format_packed(mutant_next_date(arrays['day'], arrays['month'], arrays['year'], faults))
+
+
+# name -> function(decoded arrays) -> YYYY-MM-DD / INVALID outputs
+IMPLEMENTATIONS: Dict[str, Callable[[Dict[str, np.ndarray]], List[str]]] = {'get_next_date': _oracle_outputs}
+IMPLEMENTATIONS.update({name: _mutant_outputs(name) for name in MUTANTS})
+DEFAULT_IMPLEMENTATIONS = ['get_next_date', 'original']
+
+
+# --- Exhaustive suite ---
+def write_exhaustive_suite(output_file: str, first_year: int = 1, last_year: int = 9999, perturb: bool = True) -> int:
+    """
+    Write every valid date from first_year to last_year (in ordinal order) with its next
+    date to a binary suite. With perturb, add the invalid neighbours of every month
+    (day 0, day max + 1) and of every year (months 0 and 13). Returns the case count.
+    """
+    first = date(first_year, 1, 1).toordinal()
+    last = date(last_year, 12, 31).toordinal()
+    inputs = np.arange(first, last + 1, dtype=np.int64)
+    expected = inputs + 1
+    if last_year == 9999:
+        expected[-1] = 0  # 31-12-9999 has no next date
+    if perturb:
+        years = np.arange(first_year, last_year + 1, dtype=np.int64)
+        months = np.arange(1, 13, dtype=np.int64)
+        year_grid, month_grid = np.meshgrid(years, months, indexing='ij')
+        year_grid, month_grid = year_grid.ravel(), month_grid.ravel()
+        leap = ((year_grid % 4 == 0) & (year_grid % 100 != 0)) | (year_grid % 400 == 0)
+        max_day = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[month_grid] + ((month_grid == 2) & leap)
+        packed = np.concatenate([
+            year_grid * 10000 + month_grid * 100,                 # day 0
+            year_grid * 10000 + month_grid * 100 + max_day + 1,   # day past the end of the month
+            years * 10000 + 1,                                    # month 0
+            years * 10000 + 1301,                                 # month 13
+        ])
+        inputs = np.concatenate([inputs, -(1 + packed)])
+        expected = np.concatenate([expected, np.zeros(len(packed), dtype=np.int64)])
+    write_suite_arrays(output_file, inputs, expected)
+    return len(inputs)
+
+
+# --- Coordinator ---
+def plan_shards(count: int, shard_size: int) -> List[Dict[str, int]]:
+    return [{'id': i, 'start': start, 'stop': min(start + shard_size, count)}
+            for i, start in enumerate(range(0, count, shard_size))]
+
+
+class ShardQueue:
+    """
+    Thread-safe lease bookkeeping. A shard goes back on the queue when its lease
+    expires, its worker disconnects or reports an error, until max_attempts leases
+    have been handed out; after that it is marked failed. A result that arrives
+    later still counts, until the coordinator closes the queue.
+    """
+
+    def __init__(self, shards: List[Dict[str, int]], job: Dict, lease_timeout: float = 60.0, max_attempts: int = 3):
+        self.shards = {shard['id']: shard for shard in shards}
+        self.job = job
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.pending = deque(self.shards)
+        self.leases: Dict[int, Dict] = {}  # shard id -> {'lease', 'worker', 'deadline'}
+        self.attempts = {shard_id: 0 for shard_id in self.shards}
+        self.results: Dict[int, Dict] = {}
+        self.failed: Dict[int, str] = {}
+        self.retries = 0
+        self.closed = False
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        if not self.shards:
+            self.finished.set()
+
+    def _release(self, shard_id: int, reason: str):
+        """Drop the current lease and requeue the shard (caller holds the lock)."""
+        self.leases.pop(shard_id, None)
+        if shard_id in self.results:
+            return
+        if self.attempts[shard_id] >= self.max_attempts:
+            self.failed[shard_id] = reason
+            self._check_finished()
+        else:
+            self.retries += 1
+            self.pending.appendleft(shard_id)
+
+    def _check_finished(self):
+        if len(self.results) + len(self.failed) == len(self.shards):
+            self.finished.set()
+
+    def _expire(self):
+        now = time.monotonic()
+        for shard_id, lease in list(self.leases.items()):
+            if lease['deadline'] < now:
+                self._release(shard_id, f"lease expired on {lease['worker']}")
+
+    def lease(self, worker: str) -> Dict:
+        with self.lock:
+            self._expire()
+            if self.finished.is_set():
+                return {'done': True}
+            if not self.pending:
+                return {'wait': min(1.0, self.lease_timeout / 4)}
+            shard_id = self.pending.popleft()
+            self.attempts[shard_id] += 1
+            lease_id = uuid.uuid4().hex
+            self.leases[shard_id] = {'lease': lease_id, 'worker': worker,
+                                     'deadline': time.monotonic() + self.lease_timeout}
+            return {'shard': dict(self.shards[shard_id], lease=lease_id), 'job': self.job}
+
+    def renew(self, shard_id: int, lease_id: str) -> bool:
+        with self.lock:
+            lease = self.leases.get(shard_id)
+            if not lease or lease['lease'] != lease_id:
+                return False  # expired and re-leased; the worker may finish anyway
+            lease['deadline'] = time.monotonic() + self.lease_timeout
+            return True
+
+    def complete(self, shard_id: int, lease_id: str, worker: str, result: Dict) -> bool:
+        with self.lock:
+            if self.closed:
+                return False
+            # Shards are deterministic, so a late result from an expired lease is as good as
+            # any, even for a shard already given up on: its statuses are in the file by now
+            if shard_id not in self.results:
+                self.results[shard_id] = dict(result, worker=worker)
+                self.failed.pop(shard_id, None)
+            lease = self.leases.get(shard_id)
+            if lease and lease['lease'] == lease_id:
+                del self.leases[shard_id]
+            self._check_finished()
+            return True
+
+    def fail(self, shard_id: int, lease_id: str, error: str):
+        with self.lock:
+            lease = self.leases.get(shard_id)
+            if lease and lease['lease'] == lease_id:
+                self._release(shard_id, error)
+
+    def abandon(self, leases: Dict[int, str], worker: str):
+        """Requeue the shards a disconnected worker still held."""
+        with self.lock:
+            for shard_id, lease_id in leases.items():
+                lease = self.leases.get(shard_id)
+                if lease and lease['lease'] == lease_id:
+                    self._release(shard_id, f"{worker} disconnected")
+
+    def close(self) -> List[int]:
+        """Stop accepting results; returns the shards without one."""
+        with self.lock:
+            self.closed = True
+            self.finished.set()
+            return [shard_id for shard_id in self.shards if shard_id not in self.results]
+
+    def discards(self, shard_id: int) -> bool:
+        """True once the run is closed without a result for shard_id: its statuses get cleared."""
+        with self.lock:
+            return self.closed and shard_id not in self.results
+
+    def progress(self) -> Dict[str, int]:
+        with self.lock:
+            self._expire()
+            return {'done': len(self.results), 'failed': len(self.failed), 'leased': len(self.leases),
+                    'pending': len(self.pending), 'total': len(self.shards)}
+
+
+class _QueueHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections.add(self.connection)
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            with self.server.lock:
+                self.server.connections.discard(self.connection)
+
+    def handle(self):
+        queue: ShardQueue = self.server.queue
+        worker = f"{self.client_address[0]}:{self.client_address[1]}"
+        held: Dict[int, str] = {}
+        try:
+            for line in self.rfile:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    break
+                if self.server.token and message.get('token') != self.server.token:
+                    self._reply({'error': 'bad token'})
+                    break
+                worker = message.get('worker', worker)
+                op = message.get('op')
+                if op == 'lease':
+                    reply = queue.lease(worker)
+                    if 'shard' in reply:
+                        held[reply['shard']['id']] = reply['shard']['lease']
+                elif op == 'renew':
+                    discard = queue.discards(message['shard'])  # before closed: the queue never reopens
+                    reply = {'ok': queue.renew(message['shard'], message['lease']), 'closed': queue.closed,
+                             'discard': discard}
+                elif op == 'complete':
+                    reply = {'ok': queue.complete(message['shard'], message['lease'], worker, message['result'])}
+                    held.pop(message['shard'], None)
+                elif op == 'fail':
+                    queue.fail(message['shard'], message['lease'], message.get('error', 'worker error'))
+                    held.pop(message['shard'], None)
+                    reply = {'ok': True}
+                else:
+                    reply = {'error': f"unknown op: {op}"}
+                self._reply(reply)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            queue.abandon(held, worker)
+
+    def _reply(self, reply: Dict):
+        self.wfile.write((json.dumps(reply) + '\n').encode('utf-8'))
+        self.wfile.flush()
+
+
+class _QueueServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.connections = set()  # open worker connections
+
+    def drain(self, timeout: float) -> int:
+        """Wait for every worker to disconnect, then cut off the rest. Returns how many were cut off."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if not self.connections:
+                    return 0
+            time.sleep(0.1)
+        with self.lock:
+            remaining = list(self.connections)
+        for connection in remaining:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        return len(remaining)
+
+
+def prepare_output(suite_file: str, output_file: str) -> int:
+    """Copy (or convert) the suite to the binary file workers update in place; statuses start cleared."""
+    if suite_file.lower().endswith('.nds'):
+        if os.path.abspath(suite_file) != os.path.abspath(output_file):
+            shutil.copyfile(suite_file, output_file)
+    else:
+        convert_to_binary(suite_file, output_file)
+    suite = open_suite(output_file, 'r+')
+    if len(suite):
+        suite.status[:] = 0
+        suite.status.flush()
+    return len(suite)
+
+
+def merge_results(queue: ShardQueue) -> Dict:
+    """Add up the per-shard counts, examples and per-worker shard counts."""
+    merged = {'counts': {}, 'implementations': {}, 'examples': [], 'workers': {}}
+    for shard_id in sorted(queue.results):
+        result = queue.results[shard_id]
+        for status, n in result['counts'].items():
+            merged['counts'][status] = merged['counts'].get(status, 0) + n
+        for name, counts in result.get('implementations', {}).items():
+            totals = merged['implementations'].setdefault(name, {'MATCH': 0, 'MISMATCH': 0})
+            totals['MATCH'] += counts['positive']
+            totals['MISMATCH'] += counts['negative']
+        merged['examples'].extend(result['examples'])
+        merged['workers'][result['worker']] = merged['workers'].get(result['worker'], 0) + 1
+    return merged
+
+
+def spawn_local_workers(count: int, host: str, port: int, token: Optional[str]) -> List[subprocess.Popen]:
+    command = [sys.executable, os.path.abspath(__file__), 'worker', '--host', host, '--port', str(port)]
+    if token:
+        command += ['--token', token]
+    return [subprocess.Popen(command + ['--name', f"local-{i + 1}"]) for i in range(count)]
+
+
+def run_coordinator(suite_file: str, output_file: str, mode: str = 'fill', implementations: Optional[List[str]] = None,
+                    shard_size: int = 100000, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                    lease_timeout: float = 60.0, max_attempts: int = 3, local_workers: int = 0,
+                    token: Optional[str] = None) -> Dict:
+    """
+    Split the suite into shards, serve them to workers until every shard is done or has
+    failed max_attempts times, and return the merged results. Per-case statuses end up
+    in output_file (a binary suite; convert it with binary_suite_format.py from-binary).
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode} (choose from {', '.join(MODES)})")
+    implementations = implementations or DEFAULT_IMPLEMENTATIONS
+    unknown = [name for name in implementations if name not in IMPLEMENTATIONS]
+    if unknown:
+        raise ValueError(f"Unknown implementations: {', '.join(unknown)}")
+
+    count = prepare_output(suite_file, output_file)
+    shards = plan_shards(count, shard_size)
+    job = {'suite': os.path.abspath(output_file), 'mode': mode, 'implementations': implementations}
+    queue = ShardQueue(shards, job, lease_timeout, max_attempts)
+
+    server = _QueueServer((host, port), _QueueHandler)
+    server.queue = queue
+    server.token = token
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"=== SHARDED {mode.upper()} RUN ===")
+    print(f"Suite: {suite_file} ({count} test cases, {len(shards)} shards of up to {shard_size})")
+    print(f"Coordinator listening on {host}:{port}")
+
+    workers = spawn_local_workers(local_workers, host, port, token)
+    started = time.perf_counter()
+    last_report = None
+    try:
+        while not queue.finished.wait(1.0):
+            progress = queue.progress()
+            if progress != last_report:
+                print(f"  {progress['done']}/{progress['total']} shards done, {progress['leased']} leased, "
+                      f"{progress['pending']} pending, {progress['failed']} failed")
+                last_report = progress
+            if workers and all(w.poll() is not None for w in workers) and not queue.finished.is_set():
+                print("All local workers exited before the run finished.")
+                break
+    finally:
+        # Workers asking for more work now get "done" and exit; give them a moment before closing
+        if workers:
+            for w in workers:
+                try:
+                    w.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    w.kill()
+        unfinished = queue.close()
+        # Shards without a result may hold partial statuses from a worker that gave up or
+        # was cut off; clear them so the file only carries statuses the report counts
+        if unfinished:
+            suite = open_suite(output_file, 'r+')
+            for sid in unfinished:
+                suite.status[shards[sid]['start']:shards[sid]['stop']] = 0
+            suite.status.flush()
+        # A worker that renewed just before the close can still write one chunk after the
+        # clearing; it renews after every write, is told to discard and takes the chunk
+        # back, so keep answering renewals until every worker has disconnected
+        cut_off = server.drain(lease_timeout)
+        if cut_off:
+            print(f"Cut off {cut_off} workers still connected {lease_timeout:.0f} s after the run closed")
+        server.shutdown()
+        server.server_close()
+
+    elapsed = time.perf_counter() - started
+    merged = merge_results(queue)
+    merged.update({'elapsed': elapsed, 'cases': count, 'shards': len(shards), 'completed': len(queue.results),
+                   'failed_shards': {sid: (shards[sid], queue.failed.get(sid, 'not finished')) for sid in unfinished},
+                   'retries': queue.retries, 'mode': mode, 'output': output_file})
+    return merged
+
+
+def print_sharded_report(merged: Dict):
+    print("\n=== SHARDED RUN SUMMARY ===")
+    evaluated = sum(merged['counts'].values())
+    print(f"Evaluated {evaluated}/{merged['cases']} test cases in {merged['elapsed']:.1f} s "
+          f"({evaluated / max(merged['elapsed'], 1e-9):,.0f} cases/s)")
+    print(f"Shards: {merged['completed']} completed, "
+          f"{len(merged['failed_shards'])} without a result, {merged['retries']} re-leased")
+    for status, n in sorted(merged['counts'].items()):
+        print(f"  {status}: {n}")
+
+    if merged['implementations']:
+        print("\n=== DIFFERENTIAL COMPARE PER IMPLEMENTATION ===")
+        for name, counts in merged['implementations'].items():
+            total = counts['MATCH'] + counts['MISMATCH']
+            rate = counts['MATCH'] / total * 100 if total else 0
+            print(f"{name}: {counts['MATCH']} MATCH, {counts['MISMATCH']} MISMATCH ({rate:.2f}% match)")
+
+    print("\n=== SHARDS PER WORKER ===")
+    for worker, n in sorted(merged['workers'].items()):
+        print(f"{worker}: {n}")
+
+    if merged['failed_shards']:
+        print("\n=== SHARDS WITHOUT A RESULT (statuses cleared) ===")
+        for sid, (shard, reason) in sorted(merged['failed_shards'].items()):
+            print(f"Shard {sid} [{shard['start']}, {shard['stop']}): {reason}")
+
+    if merged['examples']:
+        print("\n=== FAILING CASE EXAMPLES ===")
+        for example in merged['examples'][:10]:
+            print(f"#{example['index']} {example['input']}: expected {example['expected']}, "
+                  f"got {example['actual']}" + (f" ({example['implementation']})" if 'implementation' in example else ""))
+    print(f"\nPer-case statuses saved in: {merged['output']}")
+
+
+# --- Worker ---
+def _fill_expected_text(packed: int) -> str:
+    if packed == 0:
+        return "Invalid Date"
+    day, month, year = packed % 100, packed // 100 % 100, packed // 10000
+    try:
+        # Same formatting as get_next_date, so only the date itself is compared
+        return date(year, month, day).strftime("%d-%m-%Y")
+    except ValueError:
+        return f"{day:02d}-{month:02d}-{year:04d}"  # the suite's expectation isn't a real date
+
+
+def _fill_chunk(arrays: Dict[str, np.ndarray], offset: int, examples: List[Dict]) -> np.ndarray:
+    """Pass/Fail of get_next_date against the expected output, compared as fill_actual_results does."""
+    status = np.empty(len(arrays['day']), dtype='u1')
+    rows = zip(arrays['day'].tolist(), arrays['month'].tolist(), arrays['year'].tolist(), arrays['expected'].tolist())
+    for i, (d, m, y, e) in enumerate(rows):
+        actual = get_next_date(d, m, y)
+        expected = _fill_expected_text(e)
+        if actual == expected:
+            status[i] = STATUS_CODES['Pass']
+        else:
+            status[i] = STATUS_CODES['Fail']
+            if len(examples) < MAX_EXAMPLES:
+                examples.append({'index': offset + i, 'input': format_input_date(d, m, y),
+                                 'expected': expected, 'actual': actual})
+    return status
+
+
+def _compare_chunk(arrays: Dict[str, np.ndarray], offset: int, implementations: List[str],
+                   totals: Dict[str, Dict[str, int]], examples: List[Dict]) -> np.ndarray:
+    """MATCH where every implementation agrees with the expected output, MISMATCH otherwise."""
+    inputs = [format_input_date(d, m, y) for d, m, y in
+              zip(arrays['day'].tolist(), arrays['month'].tolist(), arrays['year'].tolist())]
+    expected = _format_packed(arrays['expected'])
+    uploaded = list(zip(inputs, expected))
+    matches = np.ones(len(inputs), dtype=bool)
+    for name in implementations:
+        outputs = IMPLEMENTATIONS[name](arrays)
+        counts = compare_cases(list(zip(inputs, outputs)), uploaded)
+        for key in ('positive', 'negative'):
+            totals[name][key] += counts[key]
+        if counts['negative']:
+            agree = np.array([a == b for a, b in zip(outputs, expected)], dtype=bool)
+            for i in np.flatnonzero(~agree)[:max(0, MAX_EXAMPLES - len(examples))]:
+                examples.append({'index': offset + int(i), 'input': inputs[i], 'expected': expected[i],
+                                 'actual': outputs[i], 'implementation': name})
+            matches &= agree
+    return np.where(matches, STATUS_CODES['MATCH'], STATUS_CODES['MISMATCH']).astype('u1')
+
+
+def run_shard(suite, job: Dict, start: int, stop: int, renew: Callable[[], Dict]) -> Dict:
+    """
+    Evaluate one shard chunk by chunk, writing statuses into the suite and renewing the
+    lease after each chunk. renew returns the coordinator's renew reply; once it says the
+    run is closed, raises ConnectionError.
+    """
+    examples: List[Dict] = []
+    totals = {name: {'positive': 0, 'negative': 0} for name in job['implementations']}
+    for chunk_start in range(start, stop, WORK_CHUNK):
+        chunk_stop = min(chunk_start + WORK_CHUNK, stop)
+        arrays = decode_suite_arrays(suite.inputs[chunk_start:chunk_stop], suite.expected[chunk_start:chunk_stop])
+        if job['mode'] == 'fill':
+            status = _fill_chunk(arrays, chunk_start, examples)
+        else:
+            status = _compare_chunk(arrays, chunk_start, job['implementations'], totals, examples)
+        suite.status[chunk_start:chunk_stop] = status
+        reply = renew()
+        if reply.get('closed'):
+            if reply.get('discard'):
+                # Closed without a result for this shard: the coordinator may already have
+                # cleared it, so take back the chunk written since the last renewal
+                suite.status[chunk_start:chunk_stop] = 0
+                suite.status.flush()
+            raise ConnectionError("coordinator closed the run")
+    suite.status.flush()
+
+    codes = np.bincount(suite.status[start:stop], minlength=len(STATUS_CODES))
+    counts = {name: int(codes[code]) for name, code in STATUS_CODES.items() if name and codes[code]}
+    result = {'counts': counts, 'examples': examples}
+    if job['mode'] == 'compare':
+        result['implementations'] = totals
+    return result
+
+
+def run_worker(host: str = '127.0.0.1', port: int = DEFAULT_PORT, token: Optional[str] = None,
+               name: Optional[str] = None, connect_timeout: float = 30.0) -> int:
+    """Lease shards from a coordinator until it reports the run done. Returns the number of shards completed."""
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            # The coordinator may not be listening yet
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+    stream = sock.makefile('rwb')
+
+    def request(message: Dict) -> Dict:
+        message = dict(message, worker=name, token=token)
+        stream.write((json.dumps(message) + '\n').encode('utf-8'))
+        stream.flush()
+        line = stream.readline()
+        if not line:
+            raise ConnectionError("coordinator closed the connection")
+        return json.loads(line)
+
+    suites = {}
+    completed = 0
+    try:
+        while True:
+            reply = request({'op': 'lease'})
+            if reply.get('done'):
+                break
+            if 'error' in reply:
+                print(f"[{name}] coordinator error: {reply['error']}")
+                break
+            if 'wait' in reply:
+                time.sleep(reply['wait'])
+                continue
+            shard, job = reply['shard'], reply['job']
+            if job['suite'] not in suites:
+                suites[job['suite']] = open_suite(job['suite'], 'r+')
+            key = {'shard': shard['id'], 'lease': shard['lease']}
+            try:
+                result = run_shard(suites[job['suite']], job, shard['start'], shard['stop'],
+                                   lambda: request(dict(key, op='renew')))
+            except (ConnectionError, OSError):
+                raise
+            except Exception as e:
+                request(dict(key, op='fail', error=f"{name}: {e}"))
+                continue
+            request(dict(key, op='complete', result=result))
+            completed += 1
+    except (ConnectionError, OSError):
+        pass  # coordinator finished and shut down
+    finally:
+        sock.close()
+    print(f"[{name}] completed {completed} shards")
+    return completed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run fill / differential compare over huge suites on several worker processes")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    coordinator = sub.add_parser('coordinator', help='Shard a suite and hand the shards out to workers')
+    coordinator.add_argument('suite', help='Suite file (.nds, CSV or XLSX)')
+    coordinator.add_argument('--mode', choices=MODES, default='fill', help='fill: Pass/Fail of get_next_date; compare: MATCH/MISMATCH per implementation')
+    coordinator.add_argument('--implementations', type=str,
+                             help=f"With --mode compare, comma-separated implementations (get_next_date or a mutant; default {','.join(DEFAULT_IMPLEMENTATIONS)})")
+    coordinator.add_argument('--output', type=str, help='Binary suite receiving per-case statuses (default: <suite>_<mode>_results.nds)')
+    coordinator.add_argument('--shard-size', type=int, default=100000, help='Test cases per shard')
+    coordinator.add_argument('--host', type=str, default='127.0.0.1', help='Address to listen on (0.0.0.0 for remote workers)')
+    coordinator.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on (0 picks a free one)')
+    coordinator.add_argument('--lease-timeout', type=float, default=60.0, help='Seconds without progress before a shard is re-leased')
+    coordinator.add_argument('--max-attempts', type=int, default=3, help='Leases per shard before it is marked failed')
+    coordinator.add_argument('--local-workers', type=int, default=0, help='Also start this many worker processes on this machine')
+    coordinator.add_argument('--token', type=str, help='Shared secret workers must present')
+
+    worker = sub.add_parser('worker', help='Process shards from a coordinator')
+    worker.add_argument('--host', type=str, default='127.0.0.1', help='Coordinator address')
+    worker.add_argument('--port', type=int, default=DEFAULT_PORT, help='Coordinator port')
+    worker.add_argument('--token', type=str, help='Shared secret of the coordinator')
+    worker.add_argument('--name', type=str, help='Worker name shown in the report')
+
+    exhaustive = sub.add_parser('exhaustive', help='Write every date in a year range (plus invalid neighbours) as a binary suite')
+    exhaustive.add_argument('output', help='Binary suite file to write')
+    exhaustive.add_argument('--first-year', type=int, default=1)
+    exhaustive.add_argument('--last-year', type=int, default=9999)
+    exhaustive.add_argument('--no-perturb', action='store_true', help='Only valid dates')
+    args = parser.parse_args()
+
+    if args.command == 'coordinator':
+        output = args.output or f"{os.path.splitext(args.suite)[0]}_{args.mode}_results.nds"
+        implementations = [name.strip() for name in args.implementations.split(',')] if args.implementations else None
+        merged = run_coordinator(args.suite, output, args.mode, implementations, args.shard_size, args.host, args.port,
+                                 args.lease_timeout, args.max_attempts, args.local_workers, args.token)
+        print_sharded_report(merged)
+    elif args.command == 'worker':
+        run_worker(args.host, args.port, args.token, args.name)
+    else:
+        count = write_exhaustive_suite(args.output, args.first_year, args.last_year, not args.no_perturb)
+        print(f"Wrote {count} test cases to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
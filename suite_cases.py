@@ -0,0 +1,127 @@
+import csv
+from datetime import date
+import pandas as pd
+from typing import List, Optional, Tuple
+from actual_test_cases import get_next_date
+from excel_schema import load_workbook_columns
+
+# A test case is (day, month, year, expected_output) where expected_output is
+# YYYY-MM-DD for valid inputs and INVALID otherwise (the Gemini CSV convention).
+Case = Tuple[int, int, int, str]
+
+
+def format_input_date(day: int, month: int, year: int) -> str:
+    """Format day/month/year as the YYYY-MM-DD string used by the CSV suites."""
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def format_iso_date(d: date) -> str:
+    """YYYY-MM-DD for a date. Not strftime: it doesn't zero-pad years below 1000 on every platform."""
+    return format_input_date(d.day, d.month, d.year)
+
+
+def parse_input_date(date_str: str) -> Optional[Tuple[int, int, int]]:
+    """Parse a YYYY-MM-DD string into (day, month, year). Returns None if malformed."""
+    parts = str(date_str).strip().split('-')
+    if len(parts) != 3:
+        return None
+    try:
+        year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
+    except ValueError:
+        return None
+    return day, month, year
+
+
+def oracle_expected(day: int, month: int, year: int) -> str:
+    """Expected output from the local oracle (get_next_date) in YYYY-MM-DD/INVALID form."""
+    actual = get_next_date(day, month, year)
+    if actual == "Invalid Date":
+        return "INVALID"
+    exp_day, exp_month, exp_year = (int(part) for part in actual.split('-'))
+    return format_input_date(exp_day, exp_month, exp_year)
+
+
+def normalize_expected(expected) -> str:
+    """Normalize an expected output from any suite layout to YYYY-MM-DD/INVALID."""
+    if isinstance(expected, date):
+        return format_iso_date(expected)  # date-typed workbook cell
+    text = str(expected).strip()
+    if text.upper() in ("INVALID", "INVALID DATE"):
+        return "INVALID"
+    for sep in ("/", "-"):
+        parts = text.split(sep)
+        if len(parts) == 3 and len(parts[0]) <= 2:
+            # DD/MM/YYYY (BVA workbook) or DD-MM-YYYY (get_next_date output)
+            try:
+                return f"{int(parts[2]):04d}-{int(parts[1]):02d}-{int(parts[0]):02d}"
+            except ValueError:
+                return "INVALID"
+    return text
+
+
+def _id_text(value) -> str:
+    # pandas turns integer ID columns with gaps into floats
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def load_suite_records(file_path: str) -> List[Tuple[Case, Optional[str], Optional[str]]]:
+    """
+    Load (case, case_id, result) records from any of the repo's suite layouts:
+    workbooks (header row and columns found by excel_schema, so the BVA layout and
+    the Day/Month/Year sheets load the same way) and input_date,expected CSV files.
+    case_id and result are None where the layout has no such column.
+    Workbooks without an Expected Output column get expectations from the local
+    oracle; with one, rows whose expected cell is blank are skipped.
+    """
+    records = []
+    if file_path.lower().endswith('.xlsx'):
+        df = load_workbook_columns(file_path, ['Test Case ID', 'Day', 'Month', 'Year', 'Expected Output',
+                                               'Valid?', 'Result (Pass/Fail)'])
+        has_expected = "Expected Output" in df.columns
+        has_valid = "Valid?" in df.columns
+        has_id = "Test Case ID" in df.columns
+        has_result = "Result (Pass/Fail)" in df.columns
+        for _, row in df.iterrows():
+            try:
+                day, month, year = int(row['Day']), int(row['Month']), int(row['Year'])
+            except (ValueError, TypeError):
+                continue
+            if not has_expected:
+                expected = oracle_expected(day, month, year)
+            elif pd.isna(row['Expected Output']):
+                continue
+            elif has_valid and str(row['Valid?']).strip().lower() == "no":
+                expected = "INVALID"
+            else:
+                expected = normalize_expected(row['Expected Output'])
+                if expected != "INVALID" and parse_input_date(expected) is None:
+                    expected = "INVALID"  # free text such as "Depends (overflow) / Error"
+            case_id = _id_text(row['Test Case ID']) if has_id and pd.notna(row['Test Case ID']) else None
+            result = str(row['Result (Pass/Fail)']).strip() if has_result and pd.notna(row['Result (Pass/Fail)']) else None
+            records.append(((day, month, year, expected), case_id, result))
+        return records
+
+    with open(file_path, 'r', newline='') as f:
+        for row in csv.reader(f):
+            if len(row) < 2:
+                continue
+            parsed = parse_input_date(row[0])
+            if parsed is None:
+                continue
+            records.append(((*parsed, normalize_expected(row[1])), None, None))
+    return records
+
+
+def load_suite_cases(file_path: str) -> List[Case]:
+    """Load just the test cases from any of the repo's suite layouts (see load_suite_records)."""
+    return [case for case, _, _ in load_suite_records(file_path)]
+
+
+def save_suite_cases_csv(cases: List[Case], filename: str):
+    """Save cases in the input_date,expected_output CSV layout (no header, like the Gemini suite)."""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        for day, month, year, expected in cases:
+            writer.writerow([format_input_date(day, month, year), expected])
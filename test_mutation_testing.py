@@ -0,0 +1,23 @@
+import os
+import unittest
+from mutation_testing import baseline_filter, load_suite_arrays, run_mutation_analysis
+
+BVA_SUITE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'NextDate_BVA_TestCases.xlsx')
+
+
+class BvaKillMatrixTest(unittest.TestCase):
+    def test_every_bva_row_is_loaded(self):
+        arrays, excluded = baseline_filter(load_suite_arrays(BVA_SUITE))
+        self.assertEqual(len(arrays['day']), 20)
+        self.assertEqual(excluded, 0)
+
+    def test_zero_field_rows_kill_their_mutants(self):
+        # S.No 5 (day 0) and S.No 14 (month 0) are the only BVA rows that kill these
+        matrix = run_mutation_analysis([BVA_SUITE], ['original', 'day_zero_accepted', 'month_zero_accepted'], workers=1)
+        self.assertFalse(matrix.loc[BVA_SUITE, 'original'])
+        self.assertTrue(matrix.loc[BVA_SUITE, 'day_zero_accepted'])
+        self.assertTrue(matrix.loc[BVA_SUITE, 'month_zero_accepted'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from providers import (GeminiProvider, OpenAICompatibleProvider, compare_providers, fan_out, make_session)
+
+GEMINI_TEXT = "2024-02-28,2024-02-29\n2023-12-31,2024-01-01\n2023-02-29,INVALID\n2024-01-01,2024-01-02"
+OPENAI_TEXT = "2024-02-28,2024-02-29\n2023-12-31,2023-12-32\n2023-02-29,Invalid Date\n1900-02-29,INVALID"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Gemini generateContent and OpenAI chat/completions endpoints with canned answers."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        url = urlparse(self.path)
+        with self.server.lock:
+            self.server.requests.append({'path': url.path, 'query': parse_qs(url.query), 'time': time.monotonic(),
+                                         'headers': dict(self.headers), 'body': body})
+        if url.path.startswith('/gemini/models/') and url.path.endswith(':generateContent'):
+            reply = {"candidates": [{"content": {"parts": [{"text": GEMINI_TEXT}]}}]}
+        elif url.path == '/openai/chat/completions':
+            reply = {"choices": [{"message": {"content": OPENAI_TEXT}}]}
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        payload = json.dumps(reply).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ProviderStubServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        cls.server.lock = threading.Lock()
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        with self.server.lock:
+            self.server.requests.clear()
+
+    def providers(self, gemini_rpm=None, openai_rpm=None):
+        session = make_session()
+        return [
+            GeminiProvider('gemini-key', base_url=f"{self.base_url}/gemini", session=session,
+                           requests_per_minute=gemini_rpm),
+            OpenAICompatibleProvider('openai-key', model='stub-model', base_url=f"{self.base_url}/openai",
+                                     session=session, requests_per_minute=openai_rpm),
+        ]
+
+    def requests_to(self, prefix):
+        return [r for r in self.server.requests if r['path'].startswith(prefix)]
+
+    def test_fan_out_queries_every_provider(self):
+        results = fan_out(self.providers(), 4, batches=3)
+
+        self.assertEqual(len(results['gemini']), 12)
+        self.assertEqual(len(results['openai']), 12)
+        gemini = self.requests_to('/gemini/')
+        openai = self.requests_to('/openai/')
+        self.assertEqual(len(gemini), 3)
+        self.assertEqual(len(openai), 3)
+        self.assertEqual(gemini[0]['path'], '/gemini/models/gemini-2.0-flash:generateContent')
+        self.assertEqual(gemini[0]['query']['key'], ['gemini-key'])
+        self.assertEqual(openai[0]['headers']['Authorization'], 'Bearer openai-key')
+        self.assertEqual(openai[0]['body']['model'], 'stub-model')
+        # Both backends get the same prompt, so their answers are comparable
+        self.assertEqual(gemini[0]['body']['contents'][0]['parts'][0]['text'],
+                         openai[0]['body']['messages'][0]['content'])
+
+    def test_rate_limit_is_per_provider(self):
+        # 600 requests/minute = one request every 0.1 s for Gemini; OpenAI is unlimited
+        fan_out(self.providers(gemini_rpm=600), 4, batches=4)
+
+        gemini = sorted(r['time'] for r in self.requests_to('/gemini/'))
+        openai = sorted(r['time'] for r in self.requests_to('/openai/'))
+        self.assertEqual(len(gemini), 4)
+        self.assertEqual(len(openai), 4)
+        for earlier, later in zip(gemini, gemini[1:]):
+            self.assertGreaterEqual(later - earlier, 0.09)
+        self.assertLess(openai[-1] - openai[0], gemini[-1] - gemini[0])
+
+    def test_compare_providers(self):
+        rows = {row['input']: row for row in compare_providers(fan_out(self.providers(), 4))}
+
+        self.assertEqual(rows['2024-02-28']['status'], 'AGREE')
+        self.assertEqual(rows['2023-12-31']['status'], 'DISAGREE')
+        # "Invalid Date" and "INVALID" are the same answer
+        self.assertEqual(rows['2023-02-29']['openai_output'], 'INVALID')
+        self.assertEqual(rows['2023-02-29']['status'], 'AGREE')
+        self.assertEqual(rows['2024-01-01']['status'], 'GEMINI_ONLY')
+        self.assertEqual(rows['2024-01-01']['openai_output'], '')
+        self.assertEqual(rows['1900-02-29']['status'], 'OPENAI_ONLY')
+        self.assertEqual(rows['2023-12-31']['oracle_output'], '2024-01-01')
+        self.assertEqual(rows['1900-02-29']['oracle_output'], 'INVALID')
+
+    def test_http_error_yields_no_cases(self):
+        provider = GeminiProvider('gemini-key', base_url=f"{self.base_url}/missing")
+        self.assertEqual(provider.generate(4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from binary_suite_format import STATUS_CODES, open_suite
+from sharded_execution import ShardQueue, plan_shards, run_coordinator, run_shard, write_exhaustive_suite
+
+LOCAL_WORKERS = {'local-1', 'local-2', 'local-3'}
+
+
+class ShardQueueTest(unittest.TestCase):
+    def test_expired_lease_is_requeued(self):
+        queue = ShardQueue(plan_shards(10, 5), {}, lease_timeout=0.05)
+        first = queue.lease('w1')['shard']
+        time.sleep(0.1)
+
+        again = queue.lease('w2')['shard']
+        self.assertEqual(again['id'], first['id'])
+        self.assertNotEqual(again['lease'], first['lease'])
+        self.assertEqual(queue.retries, 1)
+        self.assertFalse(queue.renew(first['id'], first['lease']))
+        self.assertTrue(queue.renew(again['id'], again['lease']))
+
+    def test_shard_fails_after_max_attempts(self):
+        queue = ShardQueue(plan_shards(5, 5), {}, max_attempts=2)
+        for attempt in range(2):
+            shard = queue.lease('w1')['shard']
+            queue.fail(shard['id'], shard['lease'], f"error {attempt}")
+
+        self.assertEqual(queue.failed, {0: 'error 1'})
+        self.assertEqual(queue.retries, 1)
+        self.assertTrue(queue.finished.is_set())
+        self.assertEqual(queue.lease('w1'), {'done': True})
+
+    def test_late_result_after_failure_counts(self):
+        queue = ShardQueue(plan_shards(5, 5), {}, lease_timeout=0.05, max_attempts=1)
+        shard = queue.lease('w1')['shard']
+        time.sleep(0.1)
+        self.assertEqual(queue.progress()['failed'], 1)
+
+        self.assertTrue(queue.complete(shard['id'], shard['lease'], 'w1', {'counts': {'Pass': 5}}))
+        self.assertEqual(queue.failed, {})
+        self.assertEqual(queue.results[0]['worker'], 'w1')
+        self.assertEqual(queue.close(), [])
+
+    def test_closed_queue_rejects_results(self):
+        queue = ShardQueue(plan_shards(10, 5), {})
+        shard = queue.lease('w1')['shard']
+
+        self.assertEqual(queue.close(), [0, 1])
+        self.assertTrue(queue.discards(shard['id']))
+        self.assertFalse(queue.complete(shard['id'], shard['lease'], 'w1', {'counts': {}}))
+
+
+class ShardedRunTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.suite_file = os.path.join(self.tmp.name, 'suite.nds')
+        self.output = os.path.join(self.tmp.name, 'results.nds')
+        self.count = write_exhaustive_suite(self.suite_file, 1999, 2001)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_mode(self, mode):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_coordinator(self.suite_file, self.output, mode, shard_size=50, port=0, local_workers=3)
+
+    def assert_complete(self, merged):
+        shards = len(plan_shards(self.count, 50))
+        self.assertEqual(merged['shards'], shards)
+        self.assertEqual(merged['completed'], shards)
+        self.assertEqual(merged['failed_shards'], {})
+        self.assertLessEqual(set(merged['workers']), LOCAL_WORKERS)
+        self.assertGreaterEqual(len(merged['workers']), 2)  # the shards were spread over the workers
+        self.assertEqual(sum(merged['workers'].values()), shards)
+        self.assertEqual(sum(merged['counts'].values()), self.count)
+        self.assertFalse((open_suite(self.output).status == 0).any())
+
+    def test_fill(self):
+        merged = self.run_mode('fill')
+
+        self.assert_complete(merged)
+        self.assertEqual(merged['counts'], {'Pass': self.count})
+
+    def test_compare(self):
+        merged = self.run_mode('compare')
+
+        self.assert_complete(merged)
+        self.assertEqual(merged['counts'], {'MATCH': self.count})
+        for name in ('get_next_date', 'original'):
+            self.assertEqual(merged['implementations'][name], {'MATCH': self.count, 'MISMATCH': 0})
+
+
+class RunShardTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.suite_file = os.path.join(self.tmp.name, 'suite.nds')
+        self.count = write_exhaustive_suite(self.suite_file, 2000, 2000)
+        self.suite = open_suite(self.suite_file, 'r+')
+        self.job = {'mode': 'fill', 'implementations': []}
+
+    def tearDown(self):
+        del self.suite
+        self.tmp.cleanup()
+
+    def test_chunk_written_after_close_is_taken_back(self):
+        # The run was closed (and the shard cleared) between the last renewal and this write
+        with self.assertRaises(ConnectionError):
+            run_shard(self.suite, self.job, 0, self.count, lambda: {'ok': False, 'closed': True, 'discard': True})
+        self.assertFalse(np.asarray(self.suite.status).any())
+
+    def test_chunk_of_a_finished_shard_is_kept(self):
+        with self.assertRaises(ConnectionError):
+            run_shard(self.suite, self.job, 0, self.count, lambda: {'ok': False, 'closed': True, 'discard': False})
+        self.assertTrue((np.asarray(self.suite.status) == STATUS_CODES['Pass']).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
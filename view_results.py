@@ -1,20 +1,27 @@
-import pandas as pd
+from excel_schema import load_workbook_columns
 
-# Read the results file
-df = pd.read_excel('next_date_final_with_results.xlsx')
+VIEW_COLUMNS = ['Test Case ID', 'testing', 'Day', 'Month', 'Year', 'Actual Output', 'Result (Pass/Fail)']
 
-print("=== NEXT DATE TEST RESULTS SUMMARY ===")
-print(f"Total test cases: {len(df)}")
-print(f"Valid dates (computed): {len(df[df['Actual Output'] != 'Invalid Date'])}")
-print(f"Invalid dates: {len(df[df['Actual Output'] == 'Invalid Date'])}")
+def view_results(df=None):
+    # Read the results file unless already loaded
+    if df is None:
+        df = load_workbook_columns('next_date_final_with_results.xlsx', VIEW_COLUMNS)
 
-print("\n=== SAMPLE RESULTS ===")
-print(df[['Test Case ID', 'testing', 'Day', 'Month', 'Year', 'Actual Output', 'Result (Pass/Fail)']].head(10).to_string())
+    print("=== NEXT DATE TEST RESULTS SUMMARY ===")
+    print(f"Total test cases: {len(df)}")
+    print(f"Valid dates (computed): {len(df[df['Actual Output'] != 'Invalid Date'])}")
+    print(f"Invalid dates: {len(df[df['Actual Output'] == 'Invalid Date'])}")
 
-print("\n=== INVALID DATE EXAMPLES ===")
-invalid_cases = df[df['Actual Output'] == 'Invalid Date'].head(5)
-print(invalid_cases[['Test Case ID', 'Day', 'Month', 'Year', 'Actual Output']].to_string())
+    print("\n=== SAMPLE RESULTS ===")
+    print(df[VIEW_COLUMNS].head(10).to_string())
 
-print("\n=== VALID DATE EXAMPLES ===")
-valid_cases = df[df['Actual Output'] != 'Invalid Date'].head(5)
-print(valid_cases[['Test Case ID', 'Day', 'Month', 'Year', 'Actual Output']].to_string())
+    print("\n=== INVALID DATE EXAMPLES ===")
+    invalid_cases = df[df['Actual Output'] == 'Invalid Date'].head(5)
+    print(invalid_cases[['Test Case ID', 'Day', 'Month', 'Year', 'Actual Output']].to_string())
+
+    print("\n=== VALID DATE EXAMPLES ===")
+    valid_cases = df[df['Actual Output'] != 'Invalid Date'].head(5)
+    print(valid_cases[['Test Case ID', 'Day', 'Month', 'Year', 'Actual Output']].to_string())
+
+if __name__ == "__main__":
+    view_results()
@@ -0,0 +1,120 @@
+import argparse
+import os
+import time
+from typing import Dict, List, Optional, Set
+from pipeline_runner import LOADERS, SOURCES, STAGES, run_stages
+
+
+def affected_steps(changed: Set[str], steps: Optional[List[str]] = None,
+                   available: Optional[Set[str]] = None) -> List[str]:
+    """
+    Steps to re-run, in dependency order: the selected steps downstream of the changed
+    sources, plus the upstream stages they need that are also dirty (or, given
+    `available`, whose output isn't in memory yet).
+    """
+    dirty = set(changed)
+    for name, (inputs, _) in STAGES.items():
+        if any(i in dirty for i in inputs):
+            dirty.add(name)
+
+    # Selected steps plus everything upstream of them, as run_pipeline expands its needed set
+    needed = set(steps or STAGES)
+    for name in reversed(list(STAGES)):
+        if name in needed:
+            needed.update(STAGES[name][0])
+    return [name for name in STAGES
+            if name in needed and (name in dirty or (available is not None and name not in available))]
+
+
+class PipelineWatcher:
+    """
+    Keeps parsed suites and step outputs in memory and re-runs only the steps
+    affected by files that changed since the last run.
+    """
+
+    def __init__(self, steps: Optional[List[str]] = None, persist: bool = True):
+        self.steps = steps
+        self.persist = persist
+        self.data: Dict[str, object] = {}
+        self.mtimes: Dict[str, float] = {}
+
+    @staticmethod
+    def snapshot() -> Dict[str, int]:
+        mtimes = {}
+        for name, path in SOURCES.items():
+            try:
+                mtimes[name] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return mtimes
+
+    def changed_sources(self) -> Set[str]:
+        return {name for name, mtime in self.snapshot().items() if self.mtimes.get(name) != mtime}
+
+    def reload(self, changed: Set[str]) -> Set[str]:
+        """Re-parse changed sources. A file that fails to parse keeps its previous contents."""
+        loaded = set()
+        for name in changed:
+            path = SOURCES[name]
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            # Remember the mtime even on failure: a half-written file gets retried on its next save
+            self.mtimes[name] = mtime
+            try:
+                self.data[name] = LOADERS[name](path)
+            except Exception as e:
+                print(f"Could not load {path}: {e}")
+                continue
+            loaded.add(name)
+        return loaded
+
+    def run(self, changed: Set[str]):
+        loaded = self.reload(changed)
+        run_stages(affected_steps(loaded, self.steps, set(self.data)), self.data, persist=self.persist)
+
+    def watch(self, interval: float = 0.1, debounce: float = 0.3):
+        """Poll the sources; once a burst of saves has been quiet for `debounce` seconds, re-run."""
+        print(f"Watching: {', '.join(SOURCES.values())} (Ctrl+C to stop)")
+        self.run(self.changed_sources())
+        observed = self.snapshot()
+        last_change = 0.0
+        try:
+            while True:
+                time.sleep(interval)
+                current = self.snapshot()
+                if current != observed:
+                    # Every save in a burst restarts the quiet period
+                    observed = current
+                    last_change = time.monotonic()
+                    continue
+                pending = self.changed_sources()
+                if pending and time.monotonic() - last_change >= debounce:
+                    started = time.perf_counter()
+                    print(f"\n=== CHANGE DETECTED: {', '.join(SOURCES[name] for name in sorted(pending))} ===")
+                    self.run(pending)
+                    print(f"\n=== PIPELINE UPDATED IN {(time.perf_counter() - started) * 1000:.0f} ms ===")
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run the fill/compare/analyze pipeline whenever its input files change")
+    parser.add_argument('--steps', type=str, help=f"Comma-separated subset of steps ({', '.join(STAGES)})")
+    parser.add_argument('--debounce', type=float, default=0.3, help='Seconds of quiet after a save before re-running')
+    parser.add_argument('--interval', type=float, default=0.1, help='Polling interval in seconds')
+    parser.add_argument('--once', action='store_true', help='Run the pipeline once and exit')
+    parser.add_argument('--no-persist', action='store_true', help="Don't rewrite the result files on each run")
+    args = parser.parse_args()
+
+    steps = [step.strip() for step in args.steps.split(',')] if args.steps else None
+    watcher = PipelineWatcher(steps, persist=not args.no_persist)
+    if args.once:
+        watcher.run(watcher.changed_sources())
+    else:
+        watcher.watch(args.interval, args.debounce)
+
+
+if __name__ == "__main__":
+    main()